@@ -1,6 +1,34 @@
 import argparse
-from importlib import metadata
-from sys import exit
+from typing import Any, Optional, Sequence, Union
+
+
+class VersionAction(argparse.Action):
+    """An argparse.Action to print the version of the program and exit
+
+    The version is only read from the package metadata if it is requested, which keeps it out of the startup of every
+    other invocation.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: Optional[str] = None,
+    ) -> None:
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Union[str, Sequence[Any], None],
+        option_string: Optional[str] = None,
+    ) -> None:
+        from importlib import metadata
+
+        print(f"{parser.prog} {metadata.version('arch_release_promotion')}")
+        parser.exit()
 
 
 class ArgParseFactory:
@@ -24,7 +52,7 @@ class ArgParseFactory:
         self.parser.add_argument(
             "-V",
             "--version",
-            action="store_true",
+            action=VersionAction,
             help="version information",
         )
 
@@ -48,7 +76,7 @@ class ArgParseFactory:
             type=self.non_zero_string,
             help=(
                 "the project on a remote to sign (e.g. 'group/project'). "
-                f"By default {instance.parser.prog} attempts to promote releases for "
+                "By default %(prog)s attempts to promote releases for "
                 "all projects specified in its config"
             ),
         )
@@ -58,13 +86,9 @@ class ArgParseFactory:
             type=self.non_zero_string,
             help=(
                 "the release of a project to sign (e.g. '0.1.0'). "
-                f"By default {instance.parser.prog} requires user input to select a release."
+                "By default %(prog)s requires user input to select a release."
             ),
         )
-        if instance.parser.parse_args().version:
-            print(f"{instance.parser.prog} {metadata.version('arch_release_promotion')}")
-            exit(0)
-
         return instance.parser
 
     @classmethod
@@ -87,15 +111,11 @@ class ArgParseFactory:
             type=self.non_zero_string,
             help=(
                 "the project to synchronize from a remote (e.g. 'group/project'). "
-                f"By default {instance.parser.prog} attempts to synchronize releases for "
+                "By default %(prog)s attempts to synchronize releases for "
                 "all projects specified in its config"
             ),
         )
 
-        if instance.parser.parse_args().version:
-            print(f"{instance.parser.prog} {metadata.version('arch_release_promotion')}")
-            exit(0)
-
         return instance.parser
 
     @classmethod
@@ -1,31 +1,140 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from sys import exit
-from typing import Optional
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
 
-from arch_release_promotion import (
-    argparse,
-    config,
-    files,
-    gitlab,
-    release,
-    signature,
-    torrent,
-)
+from arch_release_promotion import argparse
 
+if TYPE_CHECKING:
+    from arch_release_promotion import config, gitlab
+
+# the maximum amount of projects and of release types per project, that are promoted concurrently (signing and torrent
+# hashing are bounded across all of them by SIGN_MAX_WORKERS and TORRENT_HASH_MAX_WORKERS)
+PROMOTION_MAX_WORKERS = 4
+RELEASE_TYPE_MAX_WORKERS = 2
+
+
+def promote_release_type(
+    release_config: config.ReleaseConfig,
+    release_version: str,
+    settings: config.Settings,
+    artifact_output_path: Path,
+    metrics_file: Path,
+    promotion_base_path: Path,
+) -> None:
+    """Sign the files of a release type and write its promotion artifacts to a promotion directory
+
+    Parameters
+    ----------
+    release_config: config.ReleaseConfig
+        The ReleaseConfig object that describes the release type's configuration
+    release_version: str
+        The release version to promote
+    settings: config.Settings
+        The Settings object used for signing
+    artifact_output_path: Path
+        The directory containing the extracted build artifacts of all release types
+    metrics_file: Path
+        The metrics file of the project's release
+    promotion_base_path: Path
+        The directory to which the promotion artifacts of all release types are written
+    """
+
+    from arch_release_promotion import files, release, signature
+
+    release_prefix = f"{release_config.name}-{release_version}"
+    artifact_full_path = artifact_output_path / release_config.name / release_prefix
+    promotion_release_path = promotion_base_path / release_config.name
+    promotion_full_path = promotion_release_path / release_prefix
+    promotion_full_path.mkdir(parents=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        webseeds: Future[list[str]] | None = None
+        if release_config.create_torrent:
+            # torrentool is only required if torrent files are created
+            from arch_release_promotion import torrent
+
+            # the mirrorlist is retrieved while the files are signed
+            webseeds = executor.submit(
+                torrent.get_webseeds,
+                artifact_type=release_config.name,
+                mirrorlist_urls=settings.MIRRORLIST_URL.split(),
+                version=release_version,
+            )
+
+        signature.sign_files_in_dir(
+            path=artifact_full_path,
+            developer=settings.PACKAGER,
+            gpgkey=settings.GPGKEY,
+            file_extensions=release_config.extensions_to_sign,
+        )
+
+        metrics = files.read_metrics_file(
+            path=metrics_file,
+            version_metrics_names=release_config.version_metrics,
+            size_metrics_names=release_config.size_metrics,
+            amount_metrics_names=release_config.amount_metrics,
+        )
+
+        # the torrent file is only created once the signatures are written, as they are part of it
+        torrent_file = None
+        if webseeds is not None:
+            torrent_file = torrent.create_torrent_file(
+                path=artifact_full_path,
+                webseeds=webseeds.result(),
+                output=promotion_release_path / f"{release_prefix}.torrent",
+            )
+
+    artifact_release = release.Release(
+        name=release_config.name,
+        version=release_version,
+        files=files.files_in_dir(path=artifact_full_path),
+        amount_metrics=metrics[0],
+        size_metrics=metrics[1],
+        version_metrics=metrics[2],
+        torrent_file=torrent_file,
+        developer=settings.PACKAGER,
+        pgp_public_key=settings.GPGKEY,
+    )
+
+    files.copy_signatures(source=artifact_full_path, destination=promotion_full_path)
+    files.write_release_info_to_file(
+        release=artifact_release,
+        path=promotion_release_path / f"{release_prefix}.json",
+    )
 
-def promote_project_release(project: config.ProjectConfig, release_version: Optional[str] = None) -> None:
-    """Promote a project's release
+
+def select_project_release(
+    project: config.ProjectConfig,
+    settings: config.Settings,
+    release_version: str | None = None,
+) -> tuple[gitlab.Upstream, str]:
+    """Connect to the upstream of a project and select a release of it, that is not yet promoted
+
+    Exits with an error if there is no release to promote.
 
     Parameters
     ----------
     project: config.ProjectConfig
         The ProjectConfig object that describes the project's configuration
-    release_version: Optional[str]
+    settings: config.Settings
+        The Settings object used for interacting with the upstream
+    release_version: str | None
         The optional release version to promote. If None is provided, interactive user input is required (defaults to
         None)
+
+    Returns
+    -------
+    tuple[gitlab.Upstream, str]
+        The authenticated Upstream of the project and the selected release version
     """
 
-    settings = config.Settings()
+    # the heavy modules are only imported once it is established, that a promotion is requested (e.g. not for --help)
+    from arch_release_promotion import gitlab
+
     upstream = gitlab.Upstream(
         url=settings.GITLAB_URL,
         private_token=settings.PRIVATE_TOKEN,
@@ -38,85 +147,150 @@ def promote_project_release(project: config.ProjectConfig, release_version: Opti
         if not release_version:
             exit(1)
 
-    artifact_temp_dir = files.create_temp_dir()
-    promotion_temp_dir = files.create_temp_dir()
+    return (upstream, release_version)
 
-    artifact_zip = upstream.download_release(
-        job_name=project.job_name,
-        tag_name=release_version,
-        temp_dir=artifact_temp_dir,
-    )
-    files.extract_zip_file_to_parent_dir(path=artifact_zip)
 
-    for release_config in project.releases:
-        artifact_output_path = artifact_temp_dir / project.output_dir
-        artifact_release_path = artifact_output_path / Path(release_config.name)
-        artifact_full_path = artifact_release_path / Path(f"{release_config.name}-{release_version}")
-        promotion_base_path = promotion_temp_dir / Path("promotion")
-        promotion_release_path = promotion_base_path / Path(release_config.name)
-        promotion_full_path = promotion_release_path / Path(f"{release_config.name}-{release_version}")
-        promotion_full_path.mkdir(parents=True)
-        metrics_file = artifact_output_path / project.metrics_file
+def promote_project_release(
+    project: config.ProjectConfig,
+    settings: config.Settings,
+    upstream: gitlab.Upstream,
+    release_version: str,
+) -> None:
+    """Promote a project's release
 
-        signature.sign_files_in_dir(
-            path=artifact_full_path,
-            developer=settings.PACKAGER,
-            gpgkey=settings.GPGKEY,
-            file_extensions=release_config.extensions_to_sign,
-        )
+    Parameters
+    ----------
+    project: config.ProjectConfig
+        The ProjectConfig object that describes the project's configuration
+    settings: config.Settings
+        The Settings object used for signing
+    upstream: gitlab.Upstream
+        The authenticated Upstream of the project
+    release_version: str
+        The release version to promote
+    """
 
-        metrics = files.read_metrics_file(
-            path=metrics_file,
-            version_metrics_names=release_config.version_metrics,
-            size_metrics_names=release_config.size_metrics,
-            amount_metrics_names=release_config.amount_metrics,
-        )
-        artifact_release = release.Release(
-            name=release_config.name,
-            version=release_version,
-            files=files.files_in_dir(path=artifact_full_path),
-            amount_metrics=metrics[0],
-            size_metrics=metrics[1],
-            version_metrics=metrics[2],
-            torrent_file=torrent.create_torrent_file(
-                path=artifact_full_path,
-                webseeds=torrent.get_webseeds(
-                    artifact_type=release_config.name,
-                    mirrorlist_url=settings.MIRRORLIST_URL,
-                    version=release_version,
-                ),
-                output=promotion_release_path / Path(f"{release_config.name}-{release_version}.torrent"),
-            )
-            if release_config.create_torrent
-            else None,
-            developer=settings.PACKAGER,
-            pgp_public_key=settings.GPGKEY,
-        )
+    from arch_release_promotion import files
 
-        files.copy_signatures(source=artifact_full_path, destination=promotion_full_path)
-        files.write_release_info_to_file(
-            release=artifact_release,
-            path=(promotion_release_path / Path(f"{release_config.name}-{release_version}.json")),
+    with (
+        TemporaryDirectory(prefix=files.TEMP_DIR_PREFIX) as artifact_temp_dir_name,
+        TemporaryDirectory(prefix=files.TEMP_DIR_PREFIX) as promotion_temp_dir_name,
+    ):
+        artifact_temp_dir = Path(artifact_temp_dir_name)
+        promotion_temp_dir = Path(promotion_temp_dir_name)
+
+        artifact_zip = upstream.download_release(
+            job_name=project.job_name,
+            tag_name=release_version,
+            temp_dir=artifact_temp_dir,
         )
-        files.write_zip_file_to_parent_dir(path=promotion_base_path)
+        files.extract_zip_file_to_parent_dir(path=artifact_zip)
 
+        artifact_output_path = artifact_temp_dir / project.output_dir
+        promotion_base_path = promotion_temp_dir / "promotion"
+        metrics_file = artifact_output_path / project.metrics_file
+
+        # signing, reading metrics and creating torrent files is done for all release types concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(len(project.releases), RELEASE_TYPE_MAX_WORKERS))) as executor:
+            futures = [
+                executor.submit(
+                    promote_release_type,
+                    release_config=release_config,
+                    release_version=release_version,
+                    settings=settings,
+                    artifact_output_path=artifact_output_path,
+                    metrics_file=metrics_file,
+                    promotion_base_path=promotion_base_path,
+                )
+                for release_config in project.releases
+            ]
+            for future in futures:
+                future.result()
+
+        # the promotion artifact contains all release types and is only created and uploaded once
+        files.write_zip_file_to_parent_dir(path=promotion_base_path)
         upstream.promote_release(
             tag_name=release_version,
-            file=str(promotion_temp_dir / Path("promotion.zip")),
+            file=str(promotion_temp_dir / "promotion.zip"),
         )
 
-    files.remove_temp_dir(path=artifact_temp_dir)
-    files.remove_temp_dir(path=promotion_temp_dir)
+
+def promote_project_releases(
+    projects: list[config.ProjectConfig],
+    settings: config.Settings,
+    selections: list[tuple[gitlab.Upstream, str]],
+) -> None:
+    """Promote the selected releases of several projects concurrently
+
+    After the first failed promotion, the promotions that have not yet started are cancelled. Every failed and
+    cancelled promotion is reported.
+
+    Parameters
+    ----------
+    projects: list[config.ProjectConfig]
+        The ProjectConfig objects that describe the projects' configuration
+    settings: config.Settings
+        The Settings object used for signing
+    selections: list[tuple[gitlab.Upstream, str]]
+        The authenticated Upstream and the selected release version of each project (in the order of projects)
+
+    Raises
+    ------
+    RuntimeError
+        If the promotion of any of the projects failed
+    """
+
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(projects), PROMOTION_MAX_WORKERS))) as executor:
+        futures = {
+            executor.submit(
+                promote_project_release,
+                project=project,
+                settings=settings,
+                upstream=upstream,
+                release_version=release_version,
+            ): project.name
+            for project, (upstream, release_version) in zip(projects, selections)
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                failures.append(f"Project '{futures[future]}': Promotion cancelled after a previous failure")
+            elif future.exception():
+                failures.append(f"Project '{futures[future]}': Promotion failed: {future.exception()}")
+                for pending_future in futures:
+                    pending_future.cancel()
+
+    if failures:
+        for failure in failures:
+            print(failure)
+        raise RuntimeError(f"The promotion of {len(failures)} of {len(projects)} projects did not succeed.")
 
 
 def main() -> None:
     args = argparse.ArgParseFactory.promote().parse_args()
+
+    from arch_release_promotion import config
+
+    settings = config.get_settings()
+
     if args.project:
-        project = config.Projects().get_project(name=args.project)
-        promote_project_release(project=project, release_version=args.release if args.release else None)
+        project = config.get_projects().get_project(name=args.project)
+        upstream, release_version = select_project_release(
+            project=project,
+            settings=settings,
+            release_version=args.release if args.release else None,
+        )
+        promote_project_release(
+            project=project,
+            settings=settings,
+            upstream=upstream,
+            release_version=release_version,
+        )
     else:
-        for project in config.Projects().projects:
-            promote_project_release(project=project)
+        projects = config.get_projects().projects
+        # releases are selected interactively one project after the other, but downloaded and promoted concurrently
+        selections = [select_project_release(project=project, settings=settings) for project in projects]
+        promote_project_releases(projects=projects, settings=settings, selections=selections)
 
 
 def arch_release_sync() -> None:
@@ -127,8 +301,11 @@ def arch_release_sync() -> None:
     """
 
     args = argparse.ArgParseFactory.synchronize().parse_args()
-    projects = config.Projects()
-    settings = config.Settings()
+
+    from arch_release_promotion import config, files
+
+    projects = config.get_projects()
+    settings = config.get_upstream_settings()
 
     if args.project:
         files.ProjectFiles.sync(
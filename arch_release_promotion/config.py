@@ -1,28 +1,98 @@
+from __future__ import annotations
+
+import re
 from collections import Counter
+from functools import cached_property, lru_cache
+from os import environ
+from os.path import expanduser
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import toml
-from dotenv import dotenv_values
-from email_validator import EmailNotValidError, validate_email
-from pydantic import BaseModel, BaseSettings, Extra, root_validator, validator
-from pydantic.env_settings import SettingsSourceCallable
-from xdg.BaseDirectory import xdg_config_home
-
-MAKEPKG_CONFIGS = [
-    Path("/etc/makepkg.conf"),
-    Path(f"{xdg_config_home}/pacman/makepkg.conf"),
-    Path("~/.makepkg.conf"),
-]
-
-PROJECTS_CONFIGS = [
-    Path("/etc/arch-release-promotion/projects.toml"),
-    Path(f"{xdg_config_home}/arch-release-promotion/projects.toml"),
-]
+from typing import Any
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    import tomli as tomllib  # type: ignore[no-redef]
+
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 PROJECTS_SYNC_DIR = Path("/var/lib/arch-release-sync/")
 PROJECTS_SYNC_BACKLOG = 3
 
+# a full 40 character hexadecimal PGP fingerprint
+GPGKEY_REGEX = re.compile(r"^[0-9A-Fa-f]{40}$")
+# a PACKAGER string of the form "First Last <user@domain.tld>"
+PACKAGER_REGEX = re.compile(r"^(?P<name>[^<>]*?)\s*<(?P<email>[^<>]*)>$")
+
+
+def _xdg_config_home() -> str:
+    """Return the XDG config home directory (defaults to ~/.config if XDG_CONFIG_HOME is unset)"""
+
+    return environ.get("XDG_CONFIG_HOME") or expanduser("~/.config")
+
+
+@lru_cache(maxsize=1)
+def _makepkg_configs() -> tuple[Path, ...]:
+    """Return the (user expanded) locations of makepkg.conf files in the order in which they are read"""
+
+    return (
+        Path("/etc/makepkg.conf"),
+        Path(f"{_xdg_config_home()}/pacman/makepkg.conf"),
+        Path("~/.makepkg.conf").expanduser(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _projects_configs() -> tuple[Path, ...]:
+    """Return the locations of projects.toml files in the order in which they are read"""
+
+    return (
+        Path("/etc/arch-release-promotion/projects.toml"),
+        Path(f"{_xdg_config_home()}/arch-release-promotion/projects.toml"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _validate_email(address: str) -> None:
+    """Validate a mail address
+
+    The validation is done using emval if it is available and falls back to email_validator otherwise.
+    Both are only imported when they are needed, as email_validator pulls in dnspython and idna.
+    Valid addresses are cached, as the validation (including the deliverability check) is expensive.
+
+    Parameters
+    ----------
+    address: str
+        The mail address to validate
+
+    Raises
+    ------
+    ValueError
+        If the mail address is not valid
+    """
+
+    try:
+        from emval import validate_email as emval_validate_email
+    except ImportError:
+        from email_validator import EmailNotValidError, validate_email
+
+        try:
+            validate_email(address)
+        except EmailNotValidError as e:
+            raise ValueError(str(e))
+        return
+
+    # emval signals invalid addresses with SyntaxError
+    try:
+        emval_validate_email(address)
+    except SyntaxError as e:
+        raise ValueError(str(e))
+
 
 class ReleaseConfig(BaseModel):
     """A pydantic model describing the configuration of a project's release
@@ -31,26 +101,28 @@ class ReleaseConfig(BaseModel):
     ----------
     name: str
         The name of the release (type)
-    version_metrics: Optional[List[str]]
-        A list of names that identify labels in metric samples of type "info", that should be extracted from the
+    version_metrics: frozenset[str] | None
+        A set of names that identify labels in metric samples of type "info", that should be extracted from the
         project's metrics file
-    size_metrics: Optional[List[str]]
-        A list of names that identify labels in metric samples of type "gauge", that should be extracted from the
+    size_metrics: frozenset[str] | None
+        A set of names that identify labels in metric samples of type "gauge", that should be extracted from the
         project's metrics file
-    amount_metrics: Optional[List[str]]
-        A list of names that identify labels in metric samples of type "summary", that should be extracted from the
+    amount_metrics: frozenset[str] | None
+        A set of names that identify labels in metric samples of type "summary", that should be extracted from the
         project's metrics file
-    extensions_to_sign: List[str]
-        A list of file extensions for which to create detached signatures
+    extensions_to_sign: frozenset[str]
+        A set of file extensions for which to create detached signatures
     create_torrent: bool
         A bool indicating whether to create a torrent file for the release (defaults to False)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
-    version_metrics: Optional[List[str]]
-    size_metrics: Optional[List[str]]
-    amount_metrics: Optional[List[str]]
-    extensions_to_sign: List[str]
+    version_metrics: frozenset[str] | None = None
+    size_metrics: frozenset[str] | None = None
+    amount_metrics: frozenset[str] | None = None
+    extensions_to_sign: frozenset[str]
     create_torrent: bool = False
 
 
@@ -65,7 +137,7 @@ class SyncConfig(BaseModel):
     directory: Path
         A directory into which to sync project release types and their respective releases (defaults to
         PROJECTS_SYNC_DIR when a SysConfig instance is used in a Projects instance or a ProjectConfig instance).
-    last_updated_file: Optional[Path]
+    last_updated_file: Path | None
         The optional path to a file, that is used to write a timestamp to, if the synchronization of a project leads to
         the changing of data on disk (defaults to None).
     temp_in_sync_dir: bool
@@ -73,12 +145,47 @@ class SyncConfig(BaseModel):
         If False is specified the temporary data is downloaded to the respective user's temporary directory.
     """
 
-    backlog: Optional[int]
-    directory: Optional[Path]
-    last_updated_file: Optional[Path] = None
+    model_config = ConfigDict(frozen=True)
+
+    backlog: int | None = None
+    directory: Path | None = None
+    last_updated_file: Path | None = None
     temp_in_sync_dir: bool = True
 
 
+def merge_sync_config(sync_config: SyncConfig | None, defaults: SyncConfig) -> SyncConfig:
+    """Merge a SyncConfig with a SyncConfig providing defaults
+
+    Parameters
+    ----------
+    sync_config: SyncConfig | None
+        An optional SyncConfig instance, whose set attributes override those of defaults
+    defaults: SyncConfig
+        A SyncConfig instance providing the defaults
+
+    Returns
+    -------
+    SyncConfig
+        The defaults instance itself, if sync_config is None or does not override any of its attributes, else a new
+        SyncConfig instance with the merged attributes
+    """
+
+    if not sync_config or not (
+        sync_config.directory
+        or sync_config.backlog
+        or sync_config.last_updated_file
+        or not sync_config.temp_in_sync_dir
+    ):
+        return defaults
+
+    return SyncConfig(
+        directory=sync_config.directory or defaults.directory,
+        backlog=sync_config.backlog or defaults.backlog,
+        last_updated_file=sync_config.last_updated_file or defaults.last_updated_file,
+        temp_in_sync_dir=False if not sync_config.temp_in_sync_dir else defaults.temp_in_sync_dir,
+    )
+
+
 class ProjectConfig(BaseModel):
     """A pydantic model describing the configuration of a project
 
@@ -92,9 +199,9 @@ class ProjectConfig(BaseModel):
         The project's configured output directory for release artifacts
     metrics_file: Path
         The project's metrics file
-    releases: List[ReleaseConfig]
+    releases: list[ReleaseConfig]
         The project's list of releases
-    sync_config: Optional[SyncConfig]
+    sync_config: SyncConfig | None
         An optional SyncConfig instance, which is used to override any global defaults.
     """
 
@@ -102,8 +209,8 @@ class ProjectConfig(BaseModel):
     job_name: str
     output_dir: Path
     metrics_file: Path
-    releases: List[ReleaseConfig]
-    sync_config: Optional[SyncConfig]
+    releases: list[ReleaseConfig]
+    sync_config: SyncConfig | None = None
 
 
 class Projects(BaseSettings):
@@ -111,36 +218,37 @@ class Projects(BaseSettings):
 
     Attributes
     ----------
-    projects: List[ProjectConfig]
+    projects: list[ProjectConfig]
         A list of project configurations
-    sync_config: Optional[SyncConfig]
+    sync_config: SyncConfig | None
         An optional SyncConfig instance, which is used to override any implicit defaults and sets defaults for all
         ProjectConfig instances in projects.
     """
 
-    projects: List[ProjectConfig]
-    sync_config: Optional[SyncConfig]
-
-    class Config:
-
-        extra = Extra.ignore
-
-        @classmethod
-        def customise_sources(
-            cls,
-            init_settings: SettingsSourceCallable,
-            env_settings: SettingsSourceCallable,
-            file_secret_settings: SettingsSourceCallable,
-        ) -> Tuple[SettingsSourceCallable, ...]:
-            return (read_projects_conf,)
-
-    @validator("projects")
-    def validate_project_releases_unique(cls, projects: List[ProjectConfig]) -> List[ProjectConfig]:
+    projects: list[ProjectConfig]
+    sync_config: SyncConfig | None = None
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (ProjectsConfSource(settings_cls),)
+
+    @field_validator("projects")
+    @classmethod
+    def validate_project_releases_unique(cls, projects: list[ProjectConfig]) -> list[ProjectConfig]:
         """Validate the list of ProjectConfig instances to only contain uniquely named ReleaseConfig instances
 
         Parameters
         ----------
-        projects: List[ProjectConfig]
+        projects: list[ProjectConfig]
             A list of ProjectConfig instances
 
         Raises
@@ -150,17 +258,14 @@ class Projects(BaseSettings):
 
         Returns
         -------
-        List[ProjectConfig]
+        list[ProjectConfig]
             The unmodified list of ProjectConfig instances
         """
 
-        release_types: List[ReleaseConfig] = []
-        for project in projects:
-            release_types += project.releases
-        names = [release_type.name for release_type in release_types]
+        name_counts = Counter(release_type.name for project in projects for release_type in project.releases)
+        duplicates = [name for name, count in name_counts.items() if count > 1]
 
-        if len(set(names)) < len(names):
-            duplicates = [name for name, count in Counter(names).items() if count > 1]
+        if duplicates:
             raise ValueError(
                 f"The following release type {'name' if len(duplicates) == 1 else 'names'} "
                 f"{'is' if len(duplicates) == 1 else 'are'} not unique: "
@@ -169,23 +274,18 @@ class Projects(BaseSettings):
 
         return projects
 
-    @root_validator
-    def validate_projects(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+    @model_validator(mode="after")
+    def validate_projects(self) -> Projects:
         """Validate the list of ProjectConfig instances and override defaults
 
         If a ProjectConfig does not specify a SysConfig, override it with the global SysConfig. If a global SysConfig
         does not exist, override with an implicit default where directory defaults to PROJECTS_SYNC_DIR and backlog to
         PROJECTS_SYNC_BACKLOG.
 
-        Parameters
-        ----------
-        values: Dict[str, Any]
-            A dict with all values of the Projects instance
-
         Returns
         -------
-        values: Dict[str, Any]
-            The (potentially modified) dict with all values of the Projects instance
+        Projects
+            The (potentially modified) Projects instance
         """
 
         default_sync_config = SyncConfig(
@@ -194,36 +294,12 @@ class Projects(BaseSettings):
             last_updated_file=None,
         )
 
-        projects: List[ProjectConfig] = values.get("projects")  # type: ignore
-        sync_config: Optional[SyncConfig] = values.get("sync_config")
-
-        # merge global sync_config with defaults
-        if sync_config:
-            global_sync_config = SyncConfig(
-                directory=sync_config.directory or default_sync_config.directory,
-                backlog=sync_config.backlog or default_sync_config.backlog,
-                last_updated_file=sync_config.last_updated_file or default_sync_config.last_updated_file,
-                temp_in_sync_dir=False if not sync_config.temp_in_sync_dir else default_sync_config.temp_in_sync_dir,
-            )
-        else:
-            global_sync_config = default_sync_config
-
-        for project in projects:
-            if not project.sync_config:
-                project.sync_config = global_sync_config
-            else:
-                project.sync_config = SyncConfig(
-                    directory=project.sync_config.directory or global_sync_config.directory,
-                    backlog=project.sync_config.backlog or global_sync_config.backlog,
-                    last_updated_file=project.sync_config.last_updated_file or global_sync_config.last_updated_file,
-                    temp_in_sync_dir=False
-                    if not project.sync_config.temp_in_sync_dir
-                    else global_sync_config.temp_in_sync_dir,
-                )
+        global_sync_config = merge_sync_config(sync_config=self.sync_config, defaults=default_sync_config)
 
-        values["projects"] = projects
+        for project in self.projects:
+            project.sync_config = merge_sync_config(sync_config=project.sync_config, defaults=global_sync_config)
 
-        return values
+        return self
 
     def get_project(self, name: str) -> ProjectConfig:
         """Return a ProjectConfig by name
@@ -244,81 +320,249 @@ class Projects(BaseSettings):
             The configuration identified by the provided name
         """
 
-        for project in self.projects:
-            if project.name == name:
-                return project
+        try:
+            return self._projects_by_name[name]
+        except KeyError:
+            raise RuntimeError(f"No project configuration of the name '{name}' can be found!")
+
+    @cached_property
+    def _projects_by_name(self) -> dict[str, ProjectConfig]:
+        """A dict of all ProjectConfig instances, indexed by their name"""
+
+        return {project.name: project for project in self.projects}
+
+
+@lru_cache(maxsize=1)
+def get_projects() -> Projects:
+    """Return the Projects instance, which is only created on first use
+
+    Use get_projects.cache_clear() to enforce the creation of a new instance.
+
+    Returns
+    -------
+    Projects
+        The Projects instance describing all configured projects
+    """
+
+    return Projects()
+
+
+def _merge_dicts(target: dict[str, Any], source: dict[str, Any]) -> None:
+    """Recursively merge a dict into another
+
+    Tables present in both dicts are merged, any other value in source replaces the one in target.
+
+    Parameters
+    ----------
+    target: dict[str, Any]
+        The dict to merge into (modified in place)
+    source: dict[str, Any]
+        The dict to merge from
+    """
+
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_dicts(target[key], value)
+        else:
+            target[key] = value
+
+
+@lru_cache(maxsize=1)
+def _load_projects_conf(config_files: tuple[tuple[str, int], ...]) -> dict[str, Any]:
+    """Load and merge projects.toml files
+
+    Parameters
+    ----------
+    config_files: tuple[tuple[str, int], ...]
+        A tuple of file paths and their modification time in nanoseconds. The modification time is only used to
+        invalidate the cache if a file changes.
+
+    Returns
+    -------
+    dict[str, Any]
+        The merged configuration of all files
+    """
+
+    config: dict[str, Any] = {}
+    for config_file, _ in config_files:
+        with open(config_file, "rb") as file:
+            _merge_dicts(config, tomllib.load(file))
 
-        raise RuntimeError(f"No project configuration of the name '{name}' can be found!")
+    return config
 
 
-def read_projects_conf(settings: BaseSettings) -> Dict[str, Any]:
+def read_projects_conf() -> dict[str, Any]:
     """Read all available projects.toml files"""
 
-    config: Dict[str, Any] = {}
-    config_files: List[str] = []
-    for config_file in PROJECTS_CONFIGS:
-        if config_file.exists():
-            config_files += [str(config_file)]
+    config: dict[str, Any] = {}
+    config_files: list[tuple[str, int]] = []
+    for config_file in _projects_configs():
+        try:
+            config_files.append((str(config_file), config_file.stat().st_mtime_ns))
+        except FileNotFoundError:
+            continue
 
     if config_files:
-        config.update(toml.load(config_files))
+        config.update(_load_projects_conf(config_files=tuple(config_files)))
     else:
         raise RuntimeError("There are no project configuration files!")
 
     return config
 
 
-def read_makepkg_conf(settings: BaseSettings) -> Dict[str, Any]:
+def _parse_makepkg_conf(data: str) -> dict[str, str]:
+    """Parse the simple variable assignments of a makepkg.conf file
+
+    Only single line scalar assignments (optionally prefixed by "export") are considered, which covers all variables
+    used by this project. Arrays are skipped. Matching single or double quotes around a value are removed, as are
+    comments after unquoted values.
+
+    Parameters
+    ----------
+    data: str
+        The contents of a makepkg.conf file
+
+    Returns
+    -------
+    dict[str, str]
+        The variables defined in data
+    """
+
+    config: dict[str, str] = {}
+    for line in data.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.removeprefix("export ").partition("=")
+        key = key.strip()
+        if not key.isidentifier():
+            continue
+        value = value.strip()
+        if value.startswith("("):
+            continue
+        if value[:1] in ("'", '"') and value[0] in value[1:]:
+            value = value[1:].split(value[0], 1)[0]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        config[key] = value
+
+    return config
+
+
+def read_makepkg_conf() -> dict[str, Any]:
     """Read all available makepkg.conf files"""
 
-    config: Dict[str, Optional[str]] = {}
-    for config_file in MAKEPKG_CONFIGS:
-        config.update(dotenv_values(config_file.expanduser()))
+    config: dict[str, str] = {}
+    # later files override earlier ones, so all of them have to be read, but missing ones need not be parsed
+    for config_file in _makepkg_configs():
+        try:
+            config.update(_parse_makepkg_conf(config_file.read_text()))
+        except FileNotFoundError:
+            continue
 
     return config
 
 
-class Settings(BaseSettings):
-    """A class to describe configuration
+class ProjectsConfSource(PydanticBaseSettingsSource):
+    """A pydantic settings source providing the data of all available projects.toml files"""
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        return read_projects_conf()
+
+
+class MakepkgConfSource(PydanticBaseSettingsSource):
+    """A pydantic settings source providing the data of all available makepkg.conf files"""
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        return read_makepkg_conf()
+
+
+class UpstreamSettings(BaseSettings):
+    """A class to describe configuration required for interacting with an upstream
 
     Attributes
     ----------
     GITLAB_URL: str
         A URL for a GitLab upstream (defaults to "https://gitlab.archlinux.org")
+    PRIVATE_TOKEN: str | None
+        An optional private token to use for authenticating against an upstream
+    """
+
+    GITLAB_URL: str = "https://gitlab.archlinux.org"
+    PRIVATE_TOKEN: str | None = None
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            MakepkgConfSource(settings_cls),
+            env_settings,
+        )
+
+    @field_validator("PRIVATE_TOKEN")
+    @classmethod
+    def validate_private_token(cls, private_token: str | None) -> str | None:
+        """A validator for the PRIVATE_TOKEN attribute
+
+        Parameters
+        ----------
+        private_token: str
+            The private token string to validate
+
+        Raises
+        ------
+        ValueError
+            If the private token string is not valid
+
+        Returns
+        -------
+        str
+            A gpgkey string in long-format
+        """
+
+        if private_token is None:
+            return None
+
+        if len(private_token) < 20:
+            raise ValueError("The PRIVATE_TOKEN string has to represent a valid private token (20 chars).")
+
+        return private_token
+
+
+class Settings(UpstreamSettings):
+    """A class to describe configuration required for promoting releases
+
+    Attributes
+    ----------
     GPGKEY: str
         The PGP key id to use for artifact signatures
     MIRRORLIST_URL: str
-        A URL to derive a mirrorlist from (defaults to
+        One or more whitespace separated URLs to derive a mirrorlist from, which are tried in order (defaults to
         "https://archlinux.org/mirrorlist/?country=all&protocol=http&protocol=https")
     PACKAGER: str
         The packager name and mail address (UID) to use for artifact signatures
-    PRIVATE_TOKEN: Optional[str]
-        An optional private token to use for authenticating against an upstream
     """
 
-    GITLAB_URL: str = "https://gitlab.archlinux.org"
     GPGKEY: str
     MIRRORLIST_URL: str = "https://archlinux.org/mirrorlist/?country=all&protocol=http&protocol=https"
     PACKAGER: str
-    PRIVATE_TOKEN: Optional[str]
-
-    class Config:
-
-        extra = Extra.ignore
-
-        @classmethod
-        def customise_sources(
-            cls,
-            init_settings: SettingsSourceCallable,
-            env_settings: SettingsSourceCallable,
-            file_secret_settings: SettingsSourceCallable,
-        ) -> Tuple[SettingsSourceCallable, ...]:
-            return (
-                read_makepkg_conf,
-                env_settings,
-            )
 
-    @validator("PACKAGER")
+    @field_validator("PACKAGER")
+    @classmethod
     def validate_packager(cls, packager: str) -> str:
         """A validator for the PACKAGER attribute
 
@@ -340,26 +584,28 @@ class Settings(BaseSettings):
 
         if len(packager) == 0:
             raise ValueError("The PACKAGER string can not be empty.")
-        if not ("<" in packager and ">" in packager):
+        match = PACKAGER_REGEX.match(packager)
+        if not match:
             raise ValueError(f"The PACKAGER string has to define a mail address: {packager}")
-        split_packager = packager.replace(">", "").split("<")
-        if len(split_packager[0]) < 1:
+        if len(match["name"]) < 1:
             raise ValueError(f"The PACKAGER string has to define a name: {packager}")
+
         try:
-            validate_email(split_packager[1])
-        except EmailNotValidError as e:
+            _validate_email(match["email"])
+        except ValueError as e:
             raise ValueError(f"The PACKAGER string has to define a valid mail address: {packager}\n{e}")
 
         return packager
 
-    @validator("GPGKEY")
+    @field_validator("GPGKEY")
+    @classmethod
     def validate_gpgkey(cls, gpgkey: str) -> str:
         """A validator for the GPGKEY attribute
 
         Parameters
         ----------
         gpgkey: str
-            The packager string to validate
+            The gpgkey string to validate
 
         Raises
         ------
@@ -372,35 +618,39 @@ class Settings(BaseSettings):
             A gpgkey string in long-format
         """
 
-        if len(gpgkey) < 40:
-            raise ValueError(f"The GPGKEY string has to represent a PGP key ID in long format (40 chars): {gpgkey}")
+        if not GPGKEY_REGEX.match(gpgkey):
+            raise ValueError(
+                f"The GPGKEY string has to represent a PGP key ID in long format (40 hexadecimal chars): {gpgkey}"
+            )
 
         return gpgkey
 
-    @validator("PRIVATE_TOKEN")
-    def validate_private_token(cls, private_token: Optional[str]) -> Optional[str]:
-        """A validator for the PRIVATE_TOKEN attribute
 
-        Parameters
-        ----------
-        private_token: str
-            The private token string to validate
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the Settings instance, which is only created on first use
 
-        Raises
-        ------
-        ValueError
-            If the private token string is not valid
+    Use get_settings.cache_clear() to enforce the creation of a new instance.
 
-        Returns
-        -------
-        str
-            A gpgkey string in long-format
-        """
+    Returns
+    -------
+    Settings
+        The Settings instance describing the configuration
+    """
 
-        if private_token is None:
-            return None
+    return Settings()
 
-        if len(private_token) < 20:
-            raise ValueError("The PRIVATE_TOKEN string has to represent a valid private token (20 chars).")
 
-        return private_token
+@lru_cache(maxsize=1)
+def get_upstream_settings() -> UpstreamSettings:
+    """Return the UpstreamSettings instance, which is only created on first use
+
+    Use get_upstream_settings.cache_clear() to enforce the creation of a new instance.
+
+    Returns
+    -------
+    UpstreamSettings
+        The UpstreamSettings instance describing the configuration for interacting with an upstream
+    """
+
+    return UpstreamSettings()
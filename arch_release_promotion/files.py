@@ -1,15 +1,20 @@
+import errno
+import os
+import re
 import shutil
+import stat
 import tempfile
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import orjson
-from prometheus_client.parser import text_fd_to_metric_families
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from arch_release_promotion.config import ProjectConfig, Settings
+from arch_release_promotion.config import ProjectConfig, UpstreamSettings
 from arch_release_promotion.gitlab import Upstream
 from arch_release_promotion.release import (
     AmountMetric,
@@ -19,6 +24,32 @@ from arch_release_promotion.release import (
 )
 
 TEMP_DIR_PREFIX = "arp-"
+# the metric families read from metrics files and their expected types
+METRICS_TYPES = {"version_info": "info", "artifact_bytes": "gauge", "data_count": "summary"}
+METRICS_SAMPLE_REGEX = re.compile(
+    r'^(?P<name>version_info|artifact_bytes|data_count)\{(?P<labels>(?:[^"}]|"(?:[^"\\]|\\.)*")*)\}\s+(?P<value>\S+)'
+)
+METRICS_LABEL_REGEX = re.compile(r'(?P<key>[a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"(?P<value>(?:[^"\\]|\\.)*)"')
+METRICS_LABEL_ESCAPE_REGEX = re.compile(r"\\(.)")
+METRICS_TYPE_REGEX = re.compile(r"^#\s+TYPE\s+(?P<name>\S+)\s+(?P<type>\S+)")
+# files with these suffixes are already compressed or not compressible and are stored in ZIP files as is
+STORED_SUFFIXES = frozenset([".gz", ".img", ".iso", ".qcow2", ".sig", ".torrent", ".xz", ".zip", ".zst"])
+# the buffer size used when copying data of (potentially large) release artifacts
+COPY_BUFFER_SIZE = 1024 * 1024
+# the maximum amount of data handed to a single copy_file_range call
+COPY_FILE_RANGE_CHUNK_SIZE = 16 * 1024 * 1024
+# ZIP files with fewer members than this are extracted serially, as the thread pool would only add overhead
+ZIP_PARALLEL_EXTRACTION_THRESHOLD = 16
+ZIP_EXTRACTION_MAX_WORKERS = 8
+# JSON payloads are loaded in parallel if there are more than this
+JSON_PARALLEL_LOAD_THRESHOLD = 2
+JSON_LOAD_MAX_WORKERS = 8
+# the maximum number of release versions of a project that are synchronized concurrently
+SYNC_MAX_WORKERS = 4
+# the adapters used to validate all metrics of one type in a single call
+AMOUNT_METRICS_ADAPTER = TypeAdapter(List[AmountMetric])
+SIZE_METRICS_ADAPTER = TypeAdapter(List[SizeMetric])
+VERSION_METRICS_ADAPTER = TypeAdapter(List[VersionMetric])
 
 
 def files_in_dir(path: Path) -> List[str]:
@@ -43,7 +74,7 @@ def files_in_dir(path: Path) -> List[str]:
     if not path.is_dir():
         raise RuntimeError(f"The path is not a path: {path}")
 
-    return [child.name for child in path.iterdir()]
+    return os.listdir(path)
 
 
 def get_version_from_artifact_release_dir(path: Path) -> str:
@@ -75,44 +106,97 @@ def get_version_from_artifact_release_dir(path: Path) -> str:
     return version
 
 
-def create_temp_dir() -> Path:
-    """Create a temporary directory
+def _extract_zip_member(zip_file: zipfile.ZipFile, member: zipfile.ZipInfo, target: Path) -> None:
+    """Extract a single file member of a ZIP file
 
-    Returns
-    -------
-    Path
-        The path to the directory
+    Parameters
+    ----------
+    zip_file: zipfile.ZipFile
+        The ZIP file to read from
+    member: zipfile.ZipInfo
+        The member of zip_file to extract
+    target: Path
+        The file to write the member to
     """
 
-    return Path(tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX))
+    with zip_file.open(member) as source, open(target, "wb") as output:
+        shutil.copyfileobj(source, output, length=COPY_BUFFER_SIZE)
 
 
-def remove_temp_dir(path: Path) -> None:
-    """Remove a temporary directory recursively
+def _prepare_zip_file_members(zip_file: zipfile.ZipFile, destination: Path) -> List[Tuple[zipfile.ZipInfo, Path]]:
+    """Create the directories of a ZIP file and return its file members along with their extraction targets
 
     Parameters
     ----------
-    path: Path
-        The path to a directory to remove
+    zip_file: zipfile.ZipFile
+        The ZIP file to prepare the extraction of
+    destination: Path
+        The (resolved) directory to extract to
 
     Raises
     ------
     RuntimeError
-        If the to be removed path is not a directory or if its name does not contain TEMP_DIR_PREFIX
+        If one of the members would be extracted outside of destination
+
+    Returns
+    -------
+    List[Tuple[zipfile.ZipInfo, Path]]
+        A list of the file members of zip_file and the files to extract them to
     """
 
-    if not path.is_dir():
-        raise RuntimeError(f"The path to remove is not a directory: {path}")
+    members: List[Tuple[zipfile.ZipInfo, Path]] = []
+    for member in zip_file.infolist():
+        target = (destination / member.filename).resolve()
+        if not target.is_relative_to(destination):
+            raise RuntimeError(f"The ZIP file member {member.filename} would be extracted outside of {destination}")
 
-    if TEMP_DIR_PREFIX not in path.name:
-        raise RuntimeError(f"Can not remove a temporary directory, that is not created by the same tool: {path}")
+        if member.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            members += [(member, target)]
 
-    shutil.rmtree(path=path)
+    return members
+
+
+def _extract_zip_members_in_parallel(path: Path, members: List[Tuple[zipfile.ZipInfo, Path]]) -> None:
+    """Extract file members of a ZIP file in parallel, using one ZipFile instance per thread
+
+    Parameters
+    ----------
+    path: Path
+        The path to a ZIP file
+    members: List[Tuple[zipfile.ZipInfo, Path]]
+        A list of file members of the ZIP file and the files to extract them to
+    """
+
+    thread_data = threading.local()
+    thread_zip_files: List[zipfile.ZipFile] = []
+
+    def extract_member(member: zipfile.ZipInfo, target: Path) -> None:
+        if not hasattr(thread_data, "zip_file"):
+            thread_data.zip_file = zipfile.ZipFile(file=path, mode="r")
+            thread_zip_files.append(thread_data.zip_file)
+        _extract_zip_member(zip_file=thread_data.zip_file, member=member, target=target)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(ZIP_EXTRACTION_MAX_WORKERS, os.cpu_count() or 1))) as executor:
+            # submit the largest members first, so that a big member started last does not prolong the extraction
+            for future in [
+                executor.submit(extract_member, member, target)
+                for member, target in sorted(members, key=lambda member: member[0].file_size, reverse=True)
+            ]:
+                future.result()
+    finally:
+        for thread_zip_file in thread_zip_files:
+            thread_zip_file.close()
 
 
 def extract_zip_file_to_parent_dir(path: Path) -> None:
     """Extract the contents of a ZIP file to the parent directory of that file
 
+    ZIP files with at least ZIP_PARALLEL_EXTRACTION_THRESHOLD file members are extracted in parallel.
+
     Parameters
     ----------
     path: Path
@@ -121,14 +205,106 @@ def extract_zip_file_to_parent_dir(path: Path) -> None:
     Raises
     ------
     RuntimeError
-        If the path does not specify a valid zip file
+        If the path does not specify a valid zip file or if one of its members would be extracted outside of the parent
+        directory
+    """
+
+    # the file is only opened once, instead of checking it with zipfile.is_zipfile() first
+    try:
+        zip_file = zipfile.ZipFile(file=path, mode="r")
+    except (zipfile.BadZipFile, OSError) as e:
+        raise RuntimeError(f"The file is not a ZIP file: {path}") from e
+
+    with zip_file:
+        members = _prepare_zip_file_members(zip_file=zip_file, destination=path.parent.resolve())
+        if len(members) < ZIP_PARALLEL_EXTRACTION_THRESHOLD:
+            for member, target in members:
+                _extract_zip_member(zip_file=zip_file, member=member, target=target)
+            return
+
+    _extract_zip_members_in_parallel(path=path, members=members)
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy the contents and permission bits of a file
+
+    On Linux os.copy_file_range() is used, which allows file systems supporting it (e.g. btrfs or XFS) to share the data
+    of source and destination instead of copying it. If it is not available or not supported for the file pair,
+    shutil.copyfile() is used.
+
+    Parameters
+    ----------
+    src: Path
+        The file to copy
+    dst: Path
+        The file to copy to
+    """
+
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        with open(src, "rb") as source, open(dst, "wb") as destination:
+            try:
+                while os.copy_file_range(source.fileno(), destination.fileno(), COPY_FILE_RANGE_CHUNK_SIZE) > 0:
+                    pass
+                copied = True
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+
+    if not copied:
+        shutil.copyfile(src=src, dst=dst)
+
+    shutil.copymode(src=src, dst=dst)
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """Move a file, renaming it if possible and copying it across file systems otherwise
+
+    Parameters
+    ----------
+    src: Path
+        The file to move
+    dst: Path
+        The path to move the file to
     """
 
-    if not zipfile.is_zipfile(path):
-        raise RuntimeError(f"The file is not a ZIP file: {path}")
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_file(src=src, dst=dst)
+        shutil.copystat(src=src, dst=dst)
+        os.unlink(src)
 
-    with zipfile.ZipFile(file=path, mode="r") as zip_file:
-        zip_file.extractall(path=path.parent)
+
+def _move_release_dir(src: Path, dst: Path, files: List[str]) -> None:
+    """Move the files of a release from one directory to another
+
+    If the source directory contains exactly the files of the release and is on the same file system as the destination,
+    it is renamed as a whole. Otherwise the files are moved one by one.
+
+    Parameters
+    ----------
+    src: Path
+        The directory containing the files of the release
+    dst: Path
+        The directory to move the files to (must not exist yet)
+    files: List[str]
+        The names of the files of the release
+    """
+
+    if set(os.listdir(src)) == set(files):
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    dst.mkdir(parents=True)
+    for file in files:
+        _move_file(src=src / file, dst=dst / file)
 
 
 def copy_signatures(source: Path, destination: Path) -> None:
@@ -151,9 +327,38 @@ def copy_signatures(source: Path, destination: Path) -> None:
         if not path.is_dir():
             raise RuntimeError("The specified path is not a directory: {path}")
 
-    for file in source.iterdir():
-        if file.suffix in [".sig"]:
-            shutil.copy(src=file, dst=destination)
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.name.endswith(".sig"):
+                _copy_file(src=Path(entry.path), dst=destination / entry.name)
+
+
+def _serialize_model(obj: Any) -> Dict[str, Any]:
+    """Serialize pydantic models for orjson
+
+    This allows orjson to walk the fields of (nested) models directly, without creating an intermediate dict of the
+    whole model using BaseModel.model_dump().
+
+    Parameters
+    ----------
+    obj: Any
+        The object orjson can not serialize natively
+
+    Raises
+    ------
+    TypeError
+        If obj is not a pydantic model
+
+    Returns
+    -------
+    Dict[str, Any]
+        The fields of the model
+    """
+
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def write_release_info_to_file(release: Release, path: Path) -> None:
@@ -174,19 +379,33 @@ def write_release_info_to_file(release: Release, path: Path) -> None:
         If the file path is not writable
     """
 
-    with open(path, "wb") as file:
-        file.write(
-            orjson.dumps(release.dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SORT_KEYS)
+    data = memoryview(
+        orjson.dumps(
+            release,
+            default=_serialize_model,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SORT_KEYS,
         )
-
-
-def load_release_from_json_payload(path: Path) -> Release:
+    )
+    # the payload is written at once, so Python's buffered I/O layer is bypassed
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+def load_release_from_json_payload(path: Path, trusted: bool = False) -> Release:
     """Read a JSON payload and return it as a Release instance
 
     Parameters
     ----------
     path: Path
         The path to a file containing a JSON payload
+    trusted: bool
+        Whether the JSON payload has been written by this tool to a location it controls (defaults to False). Trusted
+        payloads are not validated, so the metrics of the returned Release instance are plain dicts.
 
     Returns
     -------
@@ -194,13 +413,75 @@ def load_release_from_json_payload(path: Path) -> Release:
         A Release instance reflecting the data from the JSON payload
     """
 
-    with open(path, "r") as file:
+    with open(path, "rb") as file:
+        if trusted:
+            return Release.model_construct(**orjson.loads(file.read()))
         return Release(**orjson.loads(file.read()))
 
 
+def _write_zip_file(path: Path, destination: Path) -> None:
+    """Write the contents of a directory to a ZIP file
+
+    Files with a suffix in STORED_SUFFIXES (e.g. images, compressed tarballs and signatures) are either already
+    compressed or not compressible, so they are stored as is. All other files (e.g. JSON payloads) are compressed using
+    the fastest compression level.
+
+    Parameters
+    ----------
+    path: Path
+        The directory to add to the ZIP file
+    destination: Path
+        The ZIP file to write
+    """
+
+    with zipfile.ZipFile(
+        file=destination,
+        mode="w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=1,
+        allowZip64=True,
+    ) as zip_file:
+        for root, dirs, file_names in os.walk(path):
+            root_path = Path(root)
+            for name in sorted(dirs):
+                zip_file.write(filename=root_path / name, arcname=(root_path / name).relative_to(path))
+            for name in sorted(file_names):
+                zip_file.write(
+                    filename=root_path / name,
+                    arcname=(root_path / name).relative_to(path),
+                    compress_type=zipfile.ZIP_STORED if Path(name).suffix in STORED_SUFFIXES else None,
+                )
+
+
+def load_releases_from_json_payloads(paths: List[Path]) -> List[Release]:
+    """Read several JSON payloads and return them as Release instances
+
+    More than JSON_PARALLEL_LOAD_THRESHOLD payloads are read concurrently.
+
+    Parameters
+    ----------
+    paths: List[Path]
+        The paths to files containing a JSON payload
+
+    Returns
+    -------
+    List[Release]
+        A list of Release instances reflecting the data from the JSON payloads (in the order of paths)
+    """
+
+    if len(paths) <= JSON_PARALLEL_LOAD_THRESHOLD:
+        return [load_release_from_json_payload(path=path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(JSON_LOAD_MAX_WORKERS, len(paths))) as executor:
+        return list(executor.map(load_release_from_json_payload, paths))
+
+
 def write_zip_file_to_parent_dir(path: Path, name: str = "promotion", format: str = "zip") -> None:
     """Create ZIP file of all contents in a directory and write it to the directory's parent
 
+    ZIP files only compress files that are not compressed already, all other formats are created using
+    shutil.make_archive().
+
     Parameters
     ----------
     path: Path
@@ -217,14 +498,63 @@ def write_zip_file_to_parent_dir(path: Path, name: str = "promotion", format: st
     if format not in known_formats:
         raise RuntimeError(f"The format must be one of {known_formats}, but {format} is provided.")
 
-    shutil.make_archive(base_name=str(path.parent / Path(name)), format=format, root_dir=path)
+    if format == "zip":
+        _write_zip_file(path=path, destination=path.parent / Path(f"{name}.zip"))
+    else:
+        shutil.make_archive(base_name=str(path.parent / Path(name)), format=format, root_dir=path)
+
+
+def _read_metrics_samples(lines: Iterable[str]) -> Iterator[Tuple[str, Dict[str, str], float]]:
+    """Read the samples of the metric families in METRICS_TYPES from a metrics file in the Prometheus text format
+
+    Only samples with labels, whose metric family is declared with the type expected in METRICS_TYPES, are returned.
+    All other lines are skipped without being parsed further.
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        The lines of a metrics file
+
+    Returns
+    -------
+    Iterator[Tuple[str, Dict[str, str], float]]
+        An iterator over tuples of name, labels and value of each sample
+    """
+
+    declared_types: Dict[str, str] = {}
+    for line in lines:
+        if line.startswith("#"):
+            type_match = METRICS_TYPE_REGEX.match(line)
+            if type_match:
+                declared_types[type_match["name"]] = type_match["type"]
+            continue
+
+        sample_match = METRICS_SAMPLE_REGEX.match(line)
+        if not sample_match or declared_types.get(sample_match["name"]) != METRICS_TYPES[sample_match["name"]]:
+            continue
+
+        try:
+            value = float(sample_match["value"])
+        except ValueError:
+            continue
+
+        yield (
+            sample_match["name"],
+            {
+                label["key"]: METRICS_LABEL_ESCAPE_REGEX.sub(
+                    lambda escape: "\n" if escape[1] == "n" else escape[1], label["value"]
+                )
+                for label in METRICS_LABEL_REGEX.finditer(sample_match["labels"])
+            },
+            value,
+        )
 
 
 def read_metrics_file(
     path: Path,
-    version_metrics_names: Optional[List[str]],
-    size_metrics_names: Optional[List[str]],
-    amount_metrics_names: Optional[List[str]],
+    version_metrics_names: Optional[Collection[str]],
+    size_metrics_names: Optional[Collection[str]],
+    amount_metrics_names: Optional[Collection[str]],
 ) -> Tuple[List[AmountMetric], List[SizeMetric], List[VersionMetric]]:
     """Read a metrics file that contains openmetrics based metrics and return those that match the respective keywords
 
@@ -232,12 +562,12 @@ def read_metrics_file(
     ----------
     path: Path
         The path of the file to read
-    version_metrics_names: Optional[List[str]]
-        A list of metric names to search for in the labels of metric samples of type "info"
-    size_metrics_names: Optional[List[str]],
-        A list of metric names to search for in the labels of metric samples of type "gauge"
-    amount_metrics_names: Optional[List[str]],
-        A list of metric names to search for in the labels of metric samples of type "summary"
+    version_metrics_names: Optional[Collection[str]]
+        A collection of metric names to search for in the labels of metric samples of type "info"
+    size_metrics_names: Optional[Collection[str]],
+        A collection of metric names to search for in the labels of metric samples of type "gauge"
+    amount_metrics_names: Optional[Collection[str]],
+        A collection of metric names to search for in the labels of metric samples of type "summary"
 
     Returns
     -------
@@ -245,61 +575,48 @@ def read_metrics_file(
         A Tuple with lists of AmountMetric, SizeMetric and VersionMetric instances derived from the input file
     """
 
-    amount_metrics: List[AmountMetric] = []
-    size_metrics: List[SizeMetric] = []
-    version_metrics: List[VersionMetric] = []
-
-    if path.exists():
-        with open(path, "r") as file:
-            for metric in text_fd_to_metric_families(file):  # type: ignore[no-untyped-call]
-                for sample in metric.samples:
-                    if (
-                        version_metrics_names
-                        and metric.type == "info"
-                        and metric.name == "version_info"
-                        and sample.labels.get("name") in version_metrics_names
-                        and sample.labels.get("description")
-                        and sample.labels.get("version")
-                    ):
-                        version_metrics += [
-                            VersionMetric(
-                                name=sample.labels.get("name"),
-                                description=sample.labels.get("description"),
-                                version=sample.labels.get("version"),
-                            )
-                        ]
-                    if (
-                        size_metrics_names
-                        and metric.type == "gauge"
-                        and metric.name == "artifact_bytes"
-                        and sample.labels.get("name") in size_metrics_names
-                        and sample.labels.get("description")
-                        and sample.value
-                    ):
-                        size_metrics += [
-                            SizeMetric(
-                                name=sample.labels.get("name"),
-                                description=sample.labels.get("description"),
-                                size=sample.value,
-                            )
-                        ]
-                    if (
-                        amount_metrics_names
-                        and metric.type == "summary"
-                        and metric.name == "data_count"
-                        and sample.labels.get("name") in amount_metrics_names
-                        and sample.labels.get("description")
-                        and sample.value
-                    ):
-                        amount_metrics += [
-                            AmountMetric(
-                                name=sample.labels.get("name"),
-                                description=sample.labels.get("description"),
-                                amount=sample.value,
-                            )
-                        ]
-
-    return (amount_metrics, size_metrics, version_metrics)
+    amount_metrics: List[Dict[str, Any]] = []
+    size_metrics: List[Dict[str, Any]] = []
+    version_metrics: List[Dict[str, Any]] = []
+    version_names = frozenset(version_metrics_names or ())
+    size_names = frozenset(size_metrics_names or ())
+    amount_names = frozenset(amount_metrics_names or ())
+
+    if not (version_names or size_names or amount_names):
+        return ([], [], [])
+
+    # the metric names to search for, by the name of the metric family providing them
+    names_by_family = {"version_info": version_names, "artifact_bytes": size_names, "data_count": amount_names}
+
+    # the file is decoded at once, instead of line by line by a text mode file object
+    try:
+        lines = path.read_bytes().decode("utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    for family, labels, value in _read_metrics_samples(lines=lines):
+        name = labels.get("name")
+        description = labels.get("description")
+        if not description or name not in names_by_family[family]:
+            continue
+
+        if family == "version_info":
+            version = labels.get("version")
+            if version:
+                version_metrics.append({"name": name, "description": description, "version": version})
+        elif not value:
+            continue
+        elif family == "artifact_bytes":
+            size_metrics.append({"name": name, "description": description, "size": int(value)})
+        else:
+            amount_metrics.append({"name": name, "description": description, "amount": int(value)})
+
+    # the models are only validated once all matching samples are collected
+    return (
+        AMOUNT_METRICS_ADAPTER.validate_python(amount_metrics),
+        SIZE_METRICS_ADAPTER.validate_python(size_metrics),
+        VERSION_METRICS_ADAPTER.validate_python(version_metrics),
+    )
 
 
 def create_dir(path: Path) -> Path:
@@ -348,10 +665,9 @@ class ProjectFiles(BaseModel):
     upstream: Upstream
     promoted_releases: List[str]
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    def __init__(self, project_config: ProjectConfig, settings: Settings) -> None:
+    def __init__(self, project_config: ProjectConfig, settings: UpstreamSettings) -> None:
         """A custom constructor to initialize an instance of ProjectFiles
 
         The names of the configured maximum number of promoted releases is retrieved using an Upstream instance.
@@ -361,8 +677,8 @@ class ProjectFiles(BaseModel):
         ----------
         project_config: ProjectConfig
             A ProjectConfig instance describing the project
-        settings: Settings
-            A Settings instance used to initialize an Upstream instance
+        settings: UpstreamSettings
+            An UpstreamSettings instance used to initialize an Upstream instance
         """
 
         upstream = Upstream(
@@ -385,15 +701,15 @@ class ProjectFiles(BaseModel):
         )
 
     @classmethod
-    def sync(self, project_config: ProjectConfig, settings: Settings) -> None:
+    def sync(self, project_config: ProjectConfig, settings: UpstreamSettings) -> None:
         """A factory method to initialize an instance of ProjectFiles and synchronize all of its promoted_releases
 
         Parameters
         ----------
         project_config: ProjectConfig
             A ProjectConfig instance describing the project
-        settings: Settings
-            A Settings instance used to initialize an Upstream instance
+        settings: UpstreamSettings
+            An UpstreamSettings instance used to initialize an Upstream instance
         """
 
         change_state: List[bool] = []
@@ -403,21 +719,33 @@ class ProjectFiles(BaseModel):
             settings=settings,
         )
 
-        for child in project_files.project_config.sync_config.directory.iterdir():  # type: ignore
-            if child.name.startswith(".tmp-"):
-                print(f"Removing pre-existing temporary directory: {child}")
-                shutil.rmtree(child)
+        with os.scandir(project_files.project_config.sync_config.directory) as entries:  # type: ignore
+            for entry in entries:
+                if entry.name.startswith(".tmp-"):
+                    print(f"Removing pre-existing temporary directory: {entry.path}")
+                    shutil.rmtree(entry.path)
 
         with tempfile.TemporaryDirectory(
             prefix=".tmp-",
-            dir=project_files.project_config.sync_config.directory  # type: ignore
-            if project_files.project_config.sync_config.temp_in_sync_dir  # type: ignore
-            else None,
+            dir=(
+                project_files.project_config.sync_config.directory  # type: ignore
+                if project_files.project_config.sync_config.temp_in_sync_dir  # type: ignore
+                else None
+            ),
         ) as temp_dir_base_name:
-            for promoted_release in project_files.promoted_releases:
-                change_state += [
-                    project_files._sync_version(temp_dir_base=Path(temp_dir_base_name), version=promoted_release)
-                ]
+            # each version is downloaded to and moved from its own temporary directories, so they can be synchronized
+            # concurrently
+            if project_files.promoted_releases:
+                with ThreadPoolExecutor(
+                    max_workers=min(SYNC_MAX_WORKERS, len(project_files.promoted_releases))
+                ) as executor:
+                    change_state += executor.map(
+                        lambda version: project_files._sync_version(
+                            temp_dir_base=Path(temp_dir_base_name),
+                            version=version,
+                        ),
+                        project_files.promoted_releases,
+                    )
 
         change_state += [project_files._set_latest_version_symlink()]
         change_state += [project_files._remove_obsolete_releases()]
@@ -438,66 +766,74 @@ class ProjectFiles(BaseModel):
     def _remove_obsolete_releases(self) -> bool:
         """Remove obsolete releases of a project from its sync_dir"""
 
-        state: List[bool] = []
-        expected_dirs: List[Path] = []
-        expected_files: List[Path] = []
+        changed = False
+        sync_dir: Path = self.project_config.sync_config.directory  # type: ignore
 
         for release_type in self.project_config.releases:
-            release_type_dir = self.project_config.sync_config.directory / Path(release_type.name)  # type: ignore
+            release_type_dir = sync_dir / release_type.name
             print(f"Removing obsolete release files from '{release_type_dir}'...")
 
-            expected_dirs += [release_type_dir / Path("latest")]
-            expected_dirs += [
-                release_type_dir / Path(f"{release_type.name}-{version}") for version in self.promoted_releases
-            ]
-            expected_files += [
-                release_type_dir / Path(f"{release_type.name}-{version}.json") for version in self.promoted_releases
-            ]
-            expected_files += [
-                release_type_dir / Path(f"{release_type.name}-{version}.torrent") for version in self.promoted_releases
-            ]
-
-            for file in release_type_dir.iterdir():
-                if file.is_dir() and file not in expected_dirs:
-                    print(f"Removing directory '{file}'")
-                    shutil.rmtree(path=file)
-                    state += [True]
-                if file.is_file() and file not in expected_files:
-                    print(f"Removing file '{file}'")
-                    file.unlink()
-                    state += [True]
+            expected_dirs = {"latest"} | {f"{release_type.name}-{version}" for version in self.promoted_releases}
+            expected_files = {
+                f"{release_type.name}-{version}{suffix}"
+                for version in self.promoted_releases
+                for suffix in (".json", ".torrent")
+            }
+
+            # DirEntry caches the file type, so no additional stat calls are needed for regular files and directories
+            with os.scandir(release_type_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name not in expected_dirs:
+                        print(f"Removing directory '{entry.path}'")
+                        shutil.rmtree(path=entry.path)
+                        changed = True
+                    elif entry.is_file() and entry.name not in expected_files:
+                        print(f"Removing file '{entry.path}'")
+                        os.unlink(entry.path)
+                        changed = True
 
             print("Done!")
 
-        return any(state)
+        return changed
 
     def _set_latest_version_symlink(self) -> bool:
         """Set the symlink to the latest version in a project's sync_dir"""
 
-        state: List[bool] = []
+        changed = False
 
         if self.promoted_releases:
-            latest_version = sorted(self.promoted_releases)[-1]
+            latest_version = max(self.promoted_releases)
+            sync_dir: Path = self.project_config.sync_config.directory  # type: ignore
 
             for release_type in self.project_config.releases:
-                latest_link = (
-                    self.project_config.sync_config.directory / Path(release_type.name) / Path("latest")  # type: ignore
-                )
+                latest_link = sync_dir / release_type.name / "latest"
                 release_dir = Path(f"{release_type.name}-{latest_version}")
                 print(f"Establishing '{latest_version}' as latest release version for '{release_type.name}'...")
 
-                if latest_link.exists():
-                    if (latest_link.is_symlink() and latest_link.readlink() != release_dir) or latest_link.is_file():
-                        latest_link.unlink()
-                    if not latest_link.is_symlink() and latest_link.is_dir():
+                # a single lstat call establishes whether and what kind of file is in the way of the symlink
+                try:
+                    latest_link_mode: Optional[int] = os.lstat(latest_link).st_mode
+                except FileNotFoundError:
+                    latest_link_mode = None
+
+                if latest_link_mode is not None:
+                    if stat.S_ISLNK(latest_link_mode):
+                        if os.readlink(latest_link) != str(release_dir):
+                            latest_link.unlink()
+                            latest_link_mode = None
+                    elif stat.S_ISDIR(latest_link_mode):
                         shutil.rmtree(path=latest_link)
-                if not latest_link.exists():
+                        latest_link_mode = None
+                    else:
+                        latest_link.unlink()
+                        latest_link_mode = None
+                if latest_link_mode is None:
                     latest_link.symlink_to(release_dir)
-                    state += [True]
+                    changed = True
 
             print("Done!")
 
-        return any(state)
+        return changed
 
     def _sync_version(self, temp_dir_base: Optional[Path], version: str) -> bool:
         """Synchronize a project's (release) version
@@ -538,10 +874,9 @@ class ProjectFiles(BaseModel):
                     )
                     extract_zip_file_to_parent_dir(path=build_artifact)
 
-                    for release_type in [
-                        load_release_from_json_payload(path=json_payload)
-                        for json_payload in promotion_temp_dir.glob("*/*.json")
-                    ]:
+                    for release_type in load_releases_from_json_payloads(
+                        paths=list(promotion_temp_dir.glob("*/*.json"))
+                    ):
                         self.copy_release_type_promotion_artifacts_to_build_dir(
                             release_type=release_type,
                             source_base=promotion_temp_dir,
@@ -578,22 +913,28 @@ class ProjectFiles(BaseModel):
             True if the project's release type in the specified version is fully synchronized, False otherwise
         """
 
-        release_base = self.project_config.sync_config.directory / Path(name)  # type: ignore
-        release_json = release_base / Path(f"{name}-{version}.json")
-        if not release_json.exists():
+        # list the directories once instead of checking the existence of each file separately
+        release_base = self.project_config.sync_config.directory / name  # type: ignore
+        try:
+            release_base_names = set(os.listdir(release_base))
+        except FileNotFoundError:
             return False
 
-        release = load_release_from_json_payload(path=release_json)
+        if f"{name}-{version}.json" not in release_base_names:
+            return False
 
-        if release.torrent_file and not (release_base / Path(release.torrent_file)).exists():
+        # the payloads in the sync directory have been validated before being moved there
+        release = load_release_from_json_payload(path=release_base / f"{name}-{version}.json", trusted=True)
+
+        if release.torrent_file and release.torrent_file not in release_base_names:
             return False
 
-        release_dir = release_base / Path(f"{name}-{version}")
-        for file in release.files:
-            if not (release_dir / Path(file)).exists():
-                return False
+        try:
+            release_dir_names = set(os.listdir(release_base / f"{name}-{version}"))
+        except FileNotFoundError:
+            release_dir_names = set()
 
-        return True
+        return all(file in release_dir_names for file in release.files)
 
     def _project_version_requires_sync(
         self,
@@ -612,17 +953,10 @@ class ProjectFiles(BaseModel):
             True if any of the release types of the project are not yet fully synchronized, False otherwise
         """
 
-        release_type_states: List[bool] = []
-        for project_release_type in self.project_config.releases:
-            if not self._is_release_type_synced(
-                name=project_release_type.name,
-                version=version,
-            ):
-                release_type_states += [True]
-            else:
-                release_type_states += [False]
-
-        return any(release_type_states)
+        return any(
+            not self._is_release_type_synced(name=project_release_type.name, version=version)
+            for project_release_type in self.project_config.releases
+        )
 
     @classmethod
     def copy_release_type_promotion_artifacts_to_build_dir(
@@ -718,21 +1052,19 @@ class ProjectFiles(BaseModel):
             else:
                 destination_release_dir.unlink()
 
-        destination_release_dir.mkdir(parents=True)
-
-        for file in release.files:
-            shutil.move(
-                src=source_base / Path(f"{release.name}/{release.name}-{release.version}/{file}"),
-                dst=destination_release_dir / Path(f"{file}"),
-            )
+        _move_release_dir(
+            src=source_base / Path(f"{release.name}/{release.name}-{release.version}"),
+            dst=destination_release_dir,
+            files=release.files,
+        )
 
         if release.torrent_file:
-            shutil.move(
+            _move_file(
                 src=source_base / Path(f"{release.name}/{release.name}-{release.version}.torrent"),
                 dst=release_type_base / Path(f"{release.name}-{release.version}.torrent"),
             )
 
-        shutil.move(
+        _move_file(
             src=source_base / Path(f"{release.name}/{release.name}-{release.version}.json"),
             dst=release_type_base / Path(f"{release.name}-{release.version}.json"),
         )
@@ -1,9 +1,41 @@
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
-from urllib import request
+from typing import Any, List, Optional
 
 import gitlab
 
+PROMOTION_ARTIFACT_LINK_NAME = "Promotion artifact"
+# the size of the chunks in which downloads are streamed
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# the size of the buffer through which downloads are written to file
+DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+# the timeout in seconds for connecting to and reading from the location of a download
+DOWNLOAD_TIMEOUT = 60.0
+
+
+def promotion_artifact_urls(release: Any) -> List[str]:
+    """Return the URLs of the promotion artifact links of a release
+
+    The links are read from the assets embedded in the release's attributes, which avoids an additional request per
+    release.
+
+    Parameters
+    ----------
+    release: Any
+        A project release as returned by python-gitlab
+
+    Returns
+    -------
+    List[str]
+        The URLs of all links of the release, that are named PROMOTION_ARTIFACT_LINK_NAME
+    """
+
+    return [
+        link["url"]
+        for link in release.attributes.get("assets", {}).get("links", [])
+        if link.get("name") == PROMOTION_ARTIFACT_LINK_NAME
+    ]
+
 
 class Upstream(gitlab.Gitlab):
     """A class to interact with a gitlab instance
@@ -30,6 +62,20 @@ class Upstream(gitlab.Gitlab):
         if "/" in name:
             self.project_name = name.split("/")[-1]
 
+    @cached_property
+    def project(self) -> Any:
+        """The project on the gitlab instance
+
+        The project is only requested once per instance, as all methods interact with the same project.
+
+        Returns
+        -------
+        Any
+            The project as returned by python-gitlab
+        """
+
+        return self.projects.get(self.name)
+
     def select_release(self, max_releases: int = 3) -> Optional[str]:
         """Select one release from a project, that is not yet promoted
 
@@ -70,25 +116,21 @@ class Upstream(gitlab.Gitlab):
             A list of strings representing release tags of the project
         """
 
-        project = self.projects.get(self.name)
+        project = self.project
 
         release_tags: List[str] = []
 
-        for release in project.releases.list():
-            if promoted:
-                # only select releases that are promoted
-                if (
-                    any(link.name == "Promotion artifact" for link in release.links.list())
-                    and len(release_tags) < max_releases
-                ):
-                    release_tags += [release.tag_name]
-            else:
-                # only select releases that are not yet promoted
-                if (
-                    not any(link.name == "Promotion artifact" for link in release.links.list())
-                    and len(release_tags) < max_releases
-                ):
-                    release_tags += [release.tag_name]
+        if max_releases < 1:
+            return release_tags
+
+        # releases are paginated lazily, so that no further pages are requested once enough releases are found
+        for release in project.releases.list(iterator=True):
+            # only select releases that are promoted or only those that are not yet promoted
+            if bool(promotion_artifact_urls(release=release)) != promoted:
+                continue
+            release_tags.append(release.tag_name)
+            if len(release_tags) == max_releases:
+                break
 
         return release_tags
 
@@ -110,18 +152,20 @@ class Upstream(gitlab.Gitlab):
             The file path of the downloaded compressed file
         """
 
-        project = self.projects.get(self.name)
+        project = self.project
         artifact_zip = temp_dir / Path(f"{self.project_name}-{tag_name}.zip")
         try:
             print(f"Downloading build artifacts of release '{tag_name}' for '{self.name}'...")
-            with open(artifact_zip, "wb") as download:
+            # stream large chunks through a large buffer, so that few write() calls are needed
+            with open(artifact_zip, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as download:
                 project.artifacts(
                     ref_name=tag_name,
                     job=job_name,
                     streamed=True,
                     action=download.write,
+                    chunk_size=DOWNLOAD_CHUNK_SIZE,
                 )
-            print("Done!")
+            print(f"Downloaded build artifacts of release '{tag_name}' for '{self.name}'")
         except gitlab.exceptions.GitlabGetError:
             print(f"Skipping release {tag_name} as there are no artifacts to download")
 
@@ -143,13 +187,11 @@ class Upstream(gitlab.Gitlab):
             The file path of the downloaded file
         """
 
-        project = self.projects.get(self.name)
-        artifact_links: List[str] = []
-
-        for release in project.releases.list():
-            # only select releases that are promoted
-            if release.tag_name == tag_name and any(link.name == "Promotion artifact" for link in release.links.list()):
-                artifact_links += [link.url for link in release.links.list() if link.name == "Promotion artifact"]
+        project = self.project
+        try:
+            artifact_links = promotion_artifact_urls(release=project.releases.get(tag_name))
+        except gitlab.exceptions.GitlabGetError:
+            artifact_links = []
 
         if not artifact_links:
             raise RuntimeError(
@@ -162,10 +204,21 @@ class Upstream(gitlab.Gitlab):
             )
 
         print(f"Downloading promotion artifact of release '{tag_name}' for '{self.name}'...")
-        filename, headers = request.urlretrieve(artifact_links[0], filename=temp_dir / Path("promotion.zip"))
-        print("Done!")
-
-        return Path(filename)
+        filename = temp_dir / Path("promotion.zip")
+        # reuse the session of the gitlab instance, but only authenticate against the gitlab instance itself
+        with self.session.get(
+            artifact_links[0],
+            headers=self.headers if artifact_links[0].startswith(f"{self.url}/") else None,
+            timeout=DOWNLOAD_TIMEOUT,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            with open(filename, "wb", buffering=DOWNLOAD_BUFFER_SIZE) as download:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    download.write(chunk)
+        print(f"Downloaded promotion artifact of release '{tag_name}' for '{self.name}'")
+
+        return filename
 
     def promote_release(self, tag_name: str, file: str) -> None:
         """Upload a promotion file to the project and add it as a link to a release
@@ -176,14 +229,22 @@ class Upstream(gitlab.Gitlab):
             The tag_name of the project's release to attach a link to
         file: str
             The file path for a file to upload to the project
+
+        Raises
+        ------
+        RuntimeError
+            If the project has no release with the tag_name
         """
 
-        project = self.projects.get(self.name)
+        project = self.project
+        try:
+            release = project.releases.get(tag_name)
+        except gitlab.exceptions.GitlabGetError:
+            raise RuntimeError(f"There is no release '{tag_name}' of project '{project.name}' to promote.")
+
         print(f"Project '{self.name}': Uploading file {file}...")
         uploaded_file = project.upload(filename="promotion.zip", filepath=file)
         print(f"Project '{self.name}': Linking file {file} to release {tag_name}...")
-        for release in project.releases.list():
-            if release.tag_name == tag_name:
-                release.links.create(
-                    {"url": f"{self.url}/{self.name}/{uploaded_file['url']}", "name": "Promotion artifact"}
-                )
+        release.links.create(
+            {"url": f"{self.url}/{self.name}/{uploaded_file['url']}", "name": PROMOTION_ARTIFACT_LINK_NAME}
+        )
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Metric(BaseModel):
@@ -14,6 +14,8 @@ class Metric(BaseModel):
         A description for the metric
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
 
@@ -82,6 +84,6 @@ class Release(BaseModel):
     amount_metrics: List[AmountMetric]
     size_metrics: List[SizeMetric]
     version_metrics: List[VersionMetric]
-    torrent_file: Optional[str]
+    torrent_file: Optional[str] = None
     developer: str
     pgp_public_key: str
@@ -1,11 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from subprocess import run
-from typing import List
+from threading import BoundedSemaphore
+from typing import Collection
 
+# gpg-agent serializes operations on the same key, so only a few files are signed concurrently
+SIGN_MAX_WORKERS = 4
+# how often signing a file is attempted and the delay in seconds before the first retry, which doubles on every retry
+SIGN_ATTEMPTS = 3
+SIGN_RETRY_DELAY = 0.5
+# shared by all concurrently signed releases, so that at most SIGN_MAX_WORKERS gpg processes run at any time
+_sign_semaphore = BoundedSemaphore(SIGN_MAX_WORKERS)
 
-def sign_files_in_dir(path: Path, developer: str, gpgkey: str, file_extensions: List[str] = []) -> None:
+
+def _sign_file_with_retries(path: Path, developer: str, gpgkey: str) -> None:
+    """Sign a file, retrying a limited amount of times with exponential backoff if gpg fails
+
+    Parameters
+    ----------
+    path: Path
+        The path to a file to sign
+    developer: str
+        The developer mbox (i.e. "First Last <user@domain.tld>")
+    gpgkey: str
+        The PGP key to sign with
+
+    Raises
+    ------
+    RuntimeError
+        If gpg fails to sign the file in all SIGN_ATTEMPTS attempts
+    """
+
+    print(f"Creating signature for {path}...")
+    for attempt in range(SIGN_ATTEMPTS):
+        if attempt > 0:
+            time.sleep(SIGN_RETRY_DELAY * 2 ** (attempt - 1))
+        with _sign_semaphore:
+            return_code = sign_file(path=path, developer=developer, gpgkey=gpgkey)
+        if return_code == 0:
+            print(f"Created signature for {path}")
+            return
+
+    raise RuntimeError(f"Failed to sign {path} in {SIGN_ATTEMPTS} attempts, gpg returned {return_code}.")
+
+
+def sign_files_in_dir(path: Path, developer: str, gpgkey: str, file_extensions: Collection[str] = ()) -> None:
     """Create a detached PGP signature for one or more files in a release
 
+    gpg can not create detached signatures for several files in one invocation, so one gpg process is run per file,
+    with up to SIGN_MAX_WORKERS of them running concurrently across all calls.
+
     Parameters
     ----------
     path: Path
@@ -16,13 +61,18 @@ def sign_files_in_dir(path: Path, developer: str, gpgkey: str, file_extensions:
         The PGP key to sign with
     """
 
-    for _file in path.iterdir():
-        if _file.suffix in file_extensions:
-            print(f"Creating signature for {_file}...")
-            return_code = 255
-            while return_code != 0:
-                return_code = sign_file(path=_file.resolve(), developer=developer, gpgkey=gpgkey)
-            print("Done!")
+    files_to_sign = sorted(_file.resolve() for _file in path.iterdir() if _file.suffix in file_extensions)
+    if not files_to_sign:
+        return
+
+    # all files are attempted to be signed, but the first error is raised afterwards
+    with ThreadPoolExecutor(max_workers=min(SIGN_MAX_WORKERS, len(files_to_sign))) as executor:
+        futures = [
+            executor.submit(_sign_file_with_retries, path=_file, developer=developer, gpgkey=gpgkey)
+            for _file in files_to_sign
+        ]
+        for future in futures:
+            future.result()
 
 
 def sign_file(path: Path, developer: str, gpgkey: str) -> int:
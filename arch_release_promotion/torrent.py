@@ -1,13 +1,111 @@
+import hashlib
+import mmap
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import List
-from urllib.request import urlopen
+from typing import Any, Dict, List, Tuple
 
+import requests
 from torrentool.api import Torrent
+from torrentool.utils import get_app_version
+
+# the piece length of torrent files with more data than TORRENT_MIN_PIECE_LENGTH (the same as used by torrentool)
+TORRENT_PIECE_LENGTH = 256 * 1024
+TORRENT_MIN_PIECE_LENGTH = 32 * 1024
+# the amount of pieces hashed per task and the amount of threads hashing them
+TORRENT_HASH_BATCH_SIZE = 64
+TORRENT_HASH_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# the timeout in seconds for retrieving a mirrorlist
+MIRRORLIST_TIMEOUT = 10.0
+# the (commented) server lines in a mirrorlist, split around their repository and architecture placeholders
+MIRRORLIST_SERVER_REGEX = re.compile(r"^#Server = (?P<prefix>\S+?)\$repo/os/\$arch(?P<suffix>\S*)")
+# the session used to retrieve mirrorlists, which keeps connections to their hosts alive
+_session = requests.Session()
+# shared by all concurrently created torrent files, so that at most TORRENT_HASH_MAX_WORKERS threads hash pieces
+_hash_executor = ThreadPoolExecutor(max_workers=TORRENT_HASH_MAX_WORKERS)
+
+
+def _torrent_files(path: Path) -> List[Tuple[Path, int]]:
+    """Return the files of a path, that are added to a torrent file
+
+    The files are ordered the same way as torrentool orders them. Empty files are skipped.
+
+    Parameters
+    ----------
+    path: Path
+        A file or a directory
+
+    Returns
+    -------
+    List[Tuple[Path, int]]
+        A list of tuples of path and size of each file
+    """
+
+    if not path.is_dir():
+        size = path.stat().st_size
+        return [(path, size)] if size else []
+
+    torrent_files: List[Tuple[Path, int]] = []
+    for root, _, file_names in os.walk(path):
+        for name in sorted(file_names):
+            size = (Path(root) / name).stat().st_size
+            if size:
+                torrent_files.append((Path(root) / name, size))
+
+    return torrent_files
+
+
+def _hash_pieces(contents: List[memoryview], offsets: List[int], pieces: range, piece_length: int) -> bytes:
+    """Return the concatenated SHA1 digests of a range of pieces of the concatenated contents of several files
+
+    Parameters
+    ----------
+    contents: List[memoryview]
+        The (memory-mapped) contents of the files
+    offsets: List[int]
+        The offsets of the files in the concatenated contents, followed by the total size of all files
+    pieces: range
+        The indexes of the pieces to hash
+    piece_length: int
+        The length of a piece in bytes
+
+    Returns
+    -------
+    bytes
+        The SHA1 digests of the pieces
+    """
+
+    digests = bytearray()
+    for piece in pieces:
+        position = piece * piece_length
+        end = min(position + piece_length, offsets[-1])
+        index = bisect_right(offsets, position) - 1
+        piece_hash = hashlib.sha1()
+        # a piece may span several files
+        while position < end:
+            start, stop = position - offsets[index], min(end, offsets[index + 1]) - offsets[index]
+            piece_hash.update(contents[index][start:stop])
+            position += stop - start
+            index += 1
+        digests += piece_hash.digest()
+
+    return bytes(digests)
 
 
 def create_torrent_file(path: Path, webseeds: List[str], output: Path) -> str:
     """Create a torrent file for a path and write it to an output directory
 
+    The torrent file is equivalent to one created by torrentool's Torrent.create_from(), but its pieces are hashed
+    from memory-mapped files in batches of TORRENT_HASH_BATCH_SIZE by a thread pool, as hashlib releases the GIL while
+    hashing.
+
     Parameters
     ----------
     path: Path
@@ -17,35 +115,127 @@ def create_torrent_file(path: Path, webseeds: List[str], output: Path) -> str:
     output: Path
         A path to write the .torrent file to
 
+    Raises
+    ------
+    RuntimeError
+        If the path is an empty file
+
     Returns
     -------
     str
         A string representing the name of the torrent file
     """
 
-    torrent = Torrent.create_from(path)
+    torrent_files = _torrent_files(path=path)
+    if not path.is_dir() and not torrent_files:
+        raise RuntimeError(f"Unable to create a torrent file for the empty file {path}")
+
+    offsets = list(accumulate((size for _, size in torrent_files), initial=0))
+    piece_length = TORRENT_PIECE_LENGTH if offsets[-1] > TORRENT_MIN_PIECE_LENGTH else TORRENT_MIN_PIECE_LENGTH
+    piece_count = -(-offsets[-1] // piece_length)
+
+    with ExitStack() as stack:
+        # the files are memory-mapped, so that their pages are hashed without copying them
+        contents = [
+            stack.enter_context(
+                memoryview(
+                    stack.enter_context(
+                        mmap.mmap(stack.enter_context(open(file, "rb")).fileno(), 0, access=mmap.ACCESS_READ)
+                    )
+                )
+            )
+            for file, _ in torrent_files
+        ]
+        pieces = b"".join(
+            _hash_executor.map(
+                lambda start: _hash_pieces(
+                    contents=contents,
+                    offsets=offsets,
+                    pieces=range(start, min(start + TORRENT_HASH_BATCH_SIZE, piece_count)),
+                    piece_length=piece_length,
+                ),
+                range(0, piece_count, TORRENT_HASH_BATCH_SIZE),
+            )
+        )
+
+    info: Dict[str, Any] = {"name": path.name, "pieces": pieces, "piece length": piece_length}
+    if path.is_dir():
+        info["files"] = [{"length": size, "path": list(file.relative_to(path).parts)} for file, size in torrent_files]
+    else:
+        info["length"] = offsets[-1]
+
+    torrent = Torrent({"info": info})
+    torrent.created_by = get_app_version()
+    torrent.creation_date = datetime.now(tz=timezone.utc)
     torrent.webseeds = webseeds
     torrent.to_file(output)
 
     return output.name
 
 
+@lru_cache(maxsize=8)
+def _read_mirrorlist_servers(mirrorlist_url: str, timeout: float) -> Tuple[Tuple[str, str], ...]:
+    """Read the servers of a mirrorlist from a remote URL
+
+    The servers are cached per URL, so that the mirrorlist is only retrieved once for all release types.
+
+    Parameters
+    ----------
+    mirrorlist_url: str
+        A URL used to retrieve the list of mirrors
+    timeout: float
+        The timeout in seconds for connecting to and reading from the URL
+
+    Raises
+    ------
+    requests.RequestException
+        If the mirrorlist can not be retrieved
+
+    Returns
+    -------
+    Tuple[Tuple[str, str], ...]
+        The parts of each server URL before and after its repository and architecture placeholders
+    """
+
+    servers: List[Tuple[str, str]] = []
+    # the response is read line by line, instead of reading and splitting it as a whole
+    with _session.get(mirrorlist_url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.encoding = "utf-8"
+        for line in response.iter_lines(decode_unicode=True):
+            match = MIRRORLIST_SERVER_REGEX.match(line)  # type: ignore
+            if match:
+                servers.append((match["prefix"], match["suffix"]))
+
+    return tuple(servers)
+
+
 def get_webseeds(
     artifact_type: str,
-    mirrorlist_url: str,
+    mirrorlist_urls: List[str],
     version: str,
+    timeout: float = MIRRORLIST_TIMEOUT,
 ) -> List[str]:
     """Read available mirrors from a remote URL and return them in a formatted list representing the webseeds for a
     given artifact type
 
+    The URLs are tried in order until the mirrorlist can be retrieved from one of them.
+
     Parameters
     ----------
     artifact_type: str
         The artifact type to create the webseeds for
-    mirrorlist_url: str
-        A URL used to retrieve the list of mirrors
+    mirrorlist_urls: List[str]
+        The URLs used to retrieve the list of mirrors
     version: str
         The version of the artifact type to create the webseeds for
+    timeout: float
+        The timeout in seconds for connecting to and reading from each URL (defaults to MIRRORLIST_TIMEOUT)
+
+    Raises
+    ------
+    RuntimeError
+        If the mirrorlist can not be retrieved from any of the URLs
 
     Returns
     -------
@@ -53,15 +243,13 @@ def get_webseeds(
         A list of strings representing webseeds for an artifact type in a specific version
     """
 
-    webseeds: List[str] = []
-    url = urlopen(mirrorlist_url)
-    for line in url.read().decode("utf-8").split("\n"):
-        if "#Server = " in line:
-            webseeds += [
-                line.replace("#Server = ", "",).replace(
-                    "$repo/os/$arch",
-                    f"releases/{artifact_type}/{version}/",
-                )
+    for mirrorlist_url in mirrorlist_urls:
+        try:
+            return [
+                f"{prefix}releases/{artifact_type}/{version}/{suffix}"
+                for prefix, suffix in _read_mirrorlist_servers(mirrorlist_url=mirrorlist_url, timeout=timeout)
             ]
+        except requests.RequestException as e:
+            print(f"Unable to retrieve the mirrorlist from {mirrorlist_url}: {e}")
 
-    return webseeds
+    raise RuntimeError(f"Unable to retrieve the mirrorlist from any of {mirrorlist_urls}.")
@@ -0,0 +1,53 @@
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+from pytest import TempPathFactory, fixture
+
+
+@fixture(scope="session", autouse=True)
+def temp_dir_in_memory() -> Iterator[None]:
+    # the tests create many small, short-lived files, so they are created on a tmpfs if one is available
+    if sys.platform != "linux" or not os.access("/dev/shm", os.W_OK):
+        yield
+        return
+
+    default_temp_dir = tempfile.tempdir
+    tempfile.tempdir = tempfile.mkdtemp(prefix=f"arp-tests-{os.getpid()}-", dir="/dev/shm")
+    yield
+    shutil.rmtree(tempfile.tempdir, ignore_errors=True)
+    tempfile.tempdir = default_temp_dir
+
+
+@fixture(scope="session")
+def create_temp_zipfile(tmp_path_factory: TempPathFactory) -> Iterator[Path]:
+    path = tmp_path_factory.mktemp("zipfile") / "compressed.zip"
+    with zipfile.ZipFile(path, "w") as zip_file:
+        zip_file.writestr("foo", b"foobar")
+    yield path
+
+
+@fixture(scope="session")
+def create_temp_metrics_file(tmp_path_factory: TempPathFactory) -> Iterator[Path]:
+    path = tmp_path_factory.mktemp("metrics") / "metrics.txt"
+    path.write_bytes(
+        b"# TYPE version_info info\n"
+        b"# HELP version_info Package description and version information\n"
+        b'version_info{name="foo", description="Version of foo", version="1.0.0-1"} 1\n'
+        b'version_info{name="bar", not_description="Version of bar", version="1.0.0-1"} 1\n'
+        b"version_info 1\n"
+        b'version{name="foo", description="Version of foo", version="1.0.0-1"} 1\n'
+        b"# TYPE artifact_bytes gauge\n"
+        b"# HELP artifact_bytes Artifact sizes in bytes\n"
+        b'artifact_bytes{name="foo",description="Size of ISO image in MiB"} 832\n'
+        b'artifact_bytes{not_name="foo",description="Size of ISO image in MiB"} 832\n'
+        b"# TYPE data_count summary\n"
+        b"# HELP data_count The amount of packages used in specific buildmodes\n"
+        b'data_count{name="foo",description="The amount of packages in foo"} 369\n'
+        b'data_count{not_name="netboot",description="something else"} 369\n'
+    )
+    yield path
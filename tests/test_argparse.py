@@ -1,9 +1,9 @@
 from argparse import ArgumentParser, ArgumentTypeError
 from contextlib import nullcontext as does_not_raise
 from typing import ContextManager
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
-from pytest import mark, raises
+from pytest import CaptureFixture, mark, raises
 
 from arch_release_promotion import argparse
 
@@ -12,28 +12,26 @@ def test_argparse_argparsefactory() -> None:
     assert isinstance(argparse.ArgParseFactory(), argparse.ArgParseFactory)
 
 
-@patch("argparse.ArgumentParser.parse_args")
-@patch("arch_release_promotion.argparse.exit")
-@patch("arch_release_promotion.argparse.metadata")
-def test_argparse_promote(metadata_mock: Mock, exit_mock: Mock, parse_args_mock: Mock) -> None:
-    assert isinstance(argparse.ArgParseFactory.promote(), ArgumentParser)
-    assert call.version("arch_release_promotion") in metadata_mock.mock_calls
-    exit_mock.assert_called_once()
-
-    parse_args_mock.return_value = Mock(version=False)
-    assert isinstance(argparse.ArgParseFactory.promote(), ArgumentParser)
-
-
-@patch("argparse.ArgumentParser.parse_args")
-@patch("arch_release_promotion.argparse.exit")
-@patch("arch_release_promotion.argparse.metadata")
-def test_argparse_synchronize(metadata_mock: Mock, exit_mock: Mock, parse_args_mock: Mock) -> None:
-    assert isinstance(argparse.ArgParseFactory.synchronize(), ArgumentParser)
-    assert call.version("arch_release_promotion") in metadata_mock.mock_calls
-    exit_mock.assert_called_once()
-
-    parse_args_mock.return_value = Mock(version=False)
-    assert isinstance(argparse.ArgParseFactory.synchronize(), ArgumentParser)
+@patch("importlib.metadata.version", return_value="1.2.3")
+def test_argparse_promote(version_mock: Mock, capsys: CaptureFixture[str]) -> None:
+    parser = argparse.ArgParseFactory.promote()
+    version_mock.assert_not_called()
+    assert isinstance(parser, ArgumentParser)
+    with raises(SystemExit):
+        parser.parse_args(["--version"])
+    assert capsys.readouterr().out == "arch-release-promotion 1.2.3\n"
+    version_mock.assert_called_once_with("arch_release_promotion")
+
+
+@patch("importlib.metadata.version", return_value="1.2.3")
+def test_argparse_synchronize(version_mock: Mock, capsys: CaptureFixture[str]) -> None:
+    parser = argparse.ArgParseFactory.synchronize()
+    version_mock.assert_not_called()
+    assert isinstance(parser, ArgumentParser)
+    with raises(SystemExit):
+        parser.parse_args(["--version"])
+    assert capsys.readouterr().out == "arch-release-sync 1.2.3\n"
+    version_mock.assert_called_once_with("arch_release_promotion")
 
 
 @mark.parametrize(
@@ -0,0 +1,86 @@
+from typing import Any, List
+from unittest.mock import Mock, call, patch
+
+from pytest import CaptureFixture, raises
+
+from arch_release_promotion import cli
+
+
+def create_project_mock(name: str) -> Mock:
+    project = Mock()
+    project.name = name
+    return project
+
+
+@patch("arch_release_promotion.cli.promote_project_release")
+@patch("arch_release_promotion.cli.select_project_release")
+@patch("arch_release_promotion.config.get_projects")
+@patch("arch_release_promotion.config.get_settings")
+@patch("arch_release_promotion.cli.argparse.ArgParseFactory.promote")
+def test_main_promotion_fails(
+    promote_mock: Mock,
+    get_settings_mock: Mock,
+    get_projects_mock: Mock,
+    select_project_release_mock: Mock,
+    promote_project_release_mock: Mock,
+    capsys: CaptureFixture[str],
+) -> None:
+    promote_mock.return_value.parse_args.return_value = Mock(project=None, release=None)
+    projects = [create_project_mock(name="foo"), create_project_mock(name="bar")]
+    get_projects_mock.return_value.projects = projects
+    upstreams = [Mock(), Mock()]
+    select_project_release_mock.side_effect = [(upstream, "0.1.0") for upstream in upstreams]
+
+    # the failing project is submitted last, so that no other promotion can be cancelled because of it
+    def promote_project_release(project: Mock, **kwargs: Any) -> None:
+        if project.name == "bar":
+            raise RuntimeError("bar failed")
+
+    promote_project_release_mock.side_effect = promote_project_release
+
+    with raises(RuntimeError):
+        cli.main()
+    promote_project_release_mock.assert_has_calls(
+        calls=[
+            call(
+                project=project,
+                settings=get_settings_mock.return_value,
+                upstream=upstream,
+                release_version="0.1.0",
+            )
+            for project, upstream in zip(projects, upstreams)
+        ],
+        any_order=True,
+    )
+    assert capsys.readouterr().out == "Project 'bar': Promotion failed: bar failed\n"
+
+
+@patch("arch_release_promotion.cli.PROMOTION_MAX_WORKERS", 1)
+@patch("arch_release_promotion.cli.promote_project_release")
+def test_promote_project_releases_cancels_pending(
+    promote_project_release_mock: Mock,
+    capsys: CaptureFixture[str],
+) -> None:
+    projects: List[Any] = [create_project_mock(name=name) for name in ["foo", "bar", "baz"]]
+    promoted: List[str] = []
+
+    def promote_project_release(project: Mock, **kwargs: Any) -> None:
+        promoted.append(project.name)
+        if project.name == "foo":
+            raise RuntimeError("foo failed")
+
+    promote_project_release_mock.side_effect = promote_project_release
+
+    with raises(RuntimeError):
+        cli.promote_project_releases(
+            projects=projects,
+            settings=Mock(),
+            selections=[(Mock(), "0.1.0") for _ in projects],
+        )
+    failures = capsys.readouterr().out.splitlines()
+    assert failures[0] == "Project 'foo': Promotion failed: foo failed"
+    # the projects after the failed one are either already running or cancelled
+    cancelled = [failure.split("'")[1] for failure in failures[1:]]
+    assert promoted[0] == "foo"
+    assert sorted(promoted[1:] + cancelled) == ["bar", "baz"]
+    assert all(failure.endswith("Promotion cancelled after a previous failure") for failure in failures[1:])
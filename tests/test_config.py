@@ -1,10 +1,10 @@
+import os
 import random
-import tempfile
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
-from string import ascii_letters, ascii_uppercase
-from typing import ContextManager, List, Optional
-from unittest.mock import patch
+from string import ascii_letters, ascii_uppercase, hexdigits
+from typing import Any, ContextManager, List, Optional
+from unittest.mock import Mock, patch
 
 from pydantic import ValidationError
 from pytest import mark, raises
@@ -16,51 +16,69 @@ from arch_release_promotion import config
     "gpgkey, packager, private_token, expectation",
     [
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "Foobar McFoo <foobar@archlinux.org>",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
             does_not_raise(),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "Foobar McFoo <foobar@archlinux.org>",
             None,
             does_not_raise(),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
             raises(ValueError),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "Foobar McFoo <foobar@archlinux.org>",
-            "".join(random.choice(ascii_letters) for x in range(10)),
+            "".join(random.choices(ascii_letters, k=10)),
             raises(ValueError),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "Foobar McFoo",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
             raises(ValueError),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
             "<foobar@archlinux.org>",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
             raises(ValueError),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(40)),
+            "".join(random.choices(hexdigits, k=40)),
+            "Foobar McFoo <foo<bar@archlinux.org>",
+            "".join(random.choices(ascii_letters, k=20)),
+            raises(ValueError),
+        ),
+        (
+            "".join(random.choices(hexdigits, k=40)),
             "Foobar McFoo <foobar@mc.fooface>",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
+            raises(ValueError),
+        ),
+        (
+            "".join(random.choices(hexdigits, k=10)),
+            "Foobar McFoo <foobar@archlinux.org>",
+            "".join(random.choices(ascii_letters, k=20)),
             raises(ValueError),
         ),
         (
-            "".join(random.choice(ascii_uppercase) for x in range(10)),
+            "".join(random.choices(ascii_uppercase, k=40)),
             "Foobar McFoo <foobar@archlinux.org>",
-            "".join(random.choice(ascii_letters) for x in range(20)),
+            "".join(random.choices(ascii_letters, k=20)),
+            raises(ValueError),
+        ),
+        (
+            "".join(random.choices(hexdigits, k=42)),
+            "Foobar McFoo <foobar@archlinux.org>",
+            "".join(random.choices(ascii_letters, k=20)),
             raises(ValueError),
         ),
     ],
@@ -70,18 +88,17 @@ def test_settings(
     packager: str,
     private_token: Optional[str],
     expectation: ContextManager[str],
+    tmp_path: Path,
 ) -> None:
-    conf = tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".conf", delete=False)
-    conf.write(f"GPGKEY='{gpgkey}'\n")
-    conf.write(f"PACKAGER='{packager}'\n")
+    conf = tmp_path / "makepkg.conf"
+    rows = [f"GPGKEY='{gpgkey}'", f"PACKAGER='{packager}'"]
     if private_token:
-        conf.write(f"PRIVATE_TOKEN={private_token}\n")
-    conf.close()
+        rows.append(f"PRIVATE_TOKEN={private_token}")
+    conf.write_text("\n".join(rows) + "\n", encoding="utf-8")
 
-    with patch("arch_release_promotion.config.MAKEPKG_CONFIGS", [Path(conf.name)]):
+    with patch("arch_release_promotion.config._makepkg_configs", return_value=[conf]):
         with expectation:
             assert config.Settings()
-    Path(conf.name).unlink()
 
 
 @mark.parametrize(
@@ -154,7 +171,7 @@ def test_settings(
                 'metrics_file = "metrics.txt"',
                 'output_dir = "output"',
                 "releases = [",
-                '{name = "test",extensions_to_sign = [".baz"]}',
+                '{name = "test",extensions_to_sign = [".baz"]},',
                 '{name = "test",extensions_to_sign = [".bar"]}]',
             ],
             "foo/bar",
@@ -179,21 +196,154 @@ def test_projects(
     config_rows: List[str],
     name: str,
     expectation: ContextManager[str],
+    tmp_path: Path,
 ) -> None:
     if create_config:
-        conf = tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".conf", delete=False)
-        for row in config_rows:
-            conf.write(f"{row}\n")
-        conf.close()
+        conf = tmp_path / "projects.toml"
+        conf.write_text("\n".join(config_rows) + "\n", encoding="utf-8")
 
-        with patch("arch_release_promotion.config.PROJECTS_CONFIGS", [Path(conf.name)]):
+        with patch("arch_release_promotion.config._projects_configs", return_value=[conf]):
             with expectation:
                 projects = config.Projects()
                 assert projects
                 assert isinstance(projects.get_project(name=name), config.ProjectConfig)
-
-        Path(conf.name).unlink()
     else:
-        with patch("arch_release_promotion.config.PROJECTS_CONFIGS", [Path("foo.bar")]):
+        with patch("arch_release_promotion.config._projects_configs", return_value=[Path("foo.bar")]):
             with expectation:
                 assert config.Projects()
+
+
+@patch("arch_release_promotion.config.Projects")
+def test_get_projects(projects_mock: Mock) -> None:
+    config.get_projects.cache_clear()
+    projects = config.get_projects()
+    assert projects == projects_mock.return_value
+    assert config.get_projects() is projects
+    projects_mock.assert_called_once_with()
+    config.get_projects.cache_clear()
+
+
+@mark.parametrize(
+    "private_token, expectation",
+    [
+        ("".join(random.choices(ascii_letters, k=20)), does_not_raise()),
+        (None, does_not_raise()),
+        ("".join(random.choices(ascii_letters, k=10)), raises(ValueError)),
+    ],
+)
+def test_upstream_settings(private_token: Optional[str], expectation: ContextManager[str], tmp_path: Path) -> None:
+    conf = tmp_path / "makepkg.conf"
+    conf.write_text(f"PRIVATE_TOKEN={private_token}\n" if private_token else "")
+
+    with patch("arch_release_promotion.config._makepkg_configs", return_value=[conf]):
+        with expectation:
+            assert config.UpstreamSettings()
+
+
+@patch("arch_release_promotion.config.Settings")
+def test_get_settings(settings_mock: Mock) -> None:
+    config.get_settings.cache_clear()
+    settings = config.get_settings()
+    assert settings == settings_mock.return_value
+    assert config.get_settings() is settings
+    settings_mock.assert_called_once_with()
+    config.get_settings.cache_clear()
+
+
+def test_read_projects_conf(tmp_path: Path) -> None:
+    conf = tmp_path / "projects.toml"
+    conf.write_text("[sync_config]\nbacklog = 2\n")
+
+    with patch("arch_release_promotion.config._projects_configs", return_value=[conf]):
+        assert config.read_projects_conf() == {"sync_config": {"backlog": 2}}
+        conf.write_text("[sync_config]\nbacklog = 3\n")
+        os.utime(conf, ns=(0, 0))
+        assert config.read_projects_conf() == {"sync_config": {"backlog": 3}}
+
+
+@mark.parametrize(
+    "sync_config, returns_defaults",
+    [
+        (None, True),
+        (config.SyncConfig(), True),
+        (config.SyncConfig(directory=Path("foo")), False),
+        (config.SyncConfig(backlog=1), False),
+        (config.SyncConfig(last_updated_file=Path("foo")), False),
+        (config.SyncConfig(temp_in_sync_dir=False), False),
+    ],
+)
+def test_merge_sync_config(sync_config: Optional[config.SyncConfig], returns_defaults: bool) -> None:
+    defaults = config.SyncConfig(directory=Path("bar"), backlog=2, last_updated_file=Path("bar"))
+    merged = config.merge_sync_config(sync_config=sync_config, defaults=defaults)
+    assert (merged is defaults) is returns_defaults
+    assert merged.directory == (sync_config and sync_config.directory or defaults.directory)
+    assert merged.backlog == (sync_config and sync_config.backlog or defaults.backlog)
+    assert merged.temp_in_sync_dir is (sync_config.temp_in_sync_dir if sync_config else True)
+
+
+@patch("arch_release_promotion.config.UpstreamSettings")
+def test_get_upstream_settings(upstream_settings_mock: Mock) -> None:
+    config.get_upstream_settings.cache_clear()
+    upstream_settings = config.get_upstream_settings()
+    assert upstream_settings == upstream_settings_mock.return_value
+    assert config.get_upstream_settings() is upstream_settings
+    upstream_settings_mock.assert_called_once_with()
+    config.get_upstream_settings.cache_clear()
+
+
+@mark.parametrize("emval_available", [True, False])
+def test__validate_email(emval_available: bool) -> None:
+    with patch.dict("sys.modules", {} if emval_available else {"emval": None}):
+        with raises(ValueError):
+            config._validate_email("foobar@")
+
+
+def test__validate_email_cached() -> None:
+    config._validate_email.cache_clear()
+    with patch.dict("sys.modules", {"emval": Mock()}) as modules:
+        config._validate_email("foobar@archlinux.org")
+        config._validate_email("foobar@archlinux.org")
+        modules["emval"].validate_email.assert_called_once_with("foobar@archlinux.org")
+    config._validate_email.cache_clear()
+
+
+@mark.parametrize(
+    "data, expected",
+    [
+        ("", {}),
+        ("# PACKAGER='Foobar McFoo <foobar@archlinux.org>'\n", {}),
+        ("PACKAGER='Foobar McFoo <foobar@archlinux.org>'\n", {"PACKAGER": "Foobar McFoo <foobar@archlinux.org>"}),
+        (
+            'PACKAGER="Foobar McFoo <foobar@archlinux.org>" # comment\n',
+            {"PACKAGER": "Foobar McFoo <foobar@archlinux.org>"},
+        ),
+        ("export GPGKEY=ABCDEF # comment\n", {"GPGKEY": "ABCDEF"}),
+        ("  GPGKEY = ABCDEF\nGPGKEY=FEDCBA\n", {"GPGKEY": "FEDCBA"}),
+        ("DLAGENTS=('file::/usr/bin/curl -qgC - -o %o %u'\n  'ftp::/usr/bin/curl -qgfC - --ftp-pasv')\n", {}),
+        ("BUILDENV=(!distcc color !ccache check !sign)\n", {}),
+    ],
+)
+def test__parse_makepkg_conf(data: str, expected: dict[str, str]) -> None:
+    assert config._parse_makepkg_conf(data) == expected
+
+
+def test_frozen_config_models() -> None:
+    with raises(ValidationError):
+        config.SyncConfig().backlog = 1  # type: ignore
+    with raises(ValidationError):
+        config.ReleaseConfig(name="foo", extensions_to_sign=frozenset()).name = "bar"  # type: ignore
+
+
+@mark.parametrize(
+    "target, source, expected",
+    [
+        ({}, {"foo": 1}, {"foo": 1}),
+        ({"foo": 1}, {"foo": 2}, {"foo": 2}),
+        ({"foo": [1]}, {"foo": [2]}, {"foo": [2]}),
+        ({"foo": {"bar": 1, "baz": 1}}, {"foo": {"bar": 2}}, {"foo": {"bar": 2, "baz": 1}}),
+        ({"foo": 1}, {"foo": {"bar": 2}}, {"foo": {"bar": 2}}),
+    ],
+)
+def test__merge_dicts(target: dict[str, Any], source: dict[str, Any], expected: dict[str, Any]) -> None:
+    config._merge_dicts(target, source)
+    assert target == expected
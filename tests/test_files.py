@@ -1,94 +1,127 @@
+import errno
+import os
+import shutil
 import tempfile
 import zipfile
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
-from typing import ContextManager, Iterator, List
+from types import SimpleNamespace
+from typing import ContextManager, Dict, Iterator, List, Optional, Tuple
 from unittest.mock import Mock, call, patch
 
-from pytest import fixture, mark, raises
+import orjson
+from pytest import MonkeyPatch, fixture, mark, raises
 
 from arch_release_promotion import config, files, release
 
-
-@fixture
-def create_temp_zipfile() -> Iterator[Path]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with tempfile.NamedTemporaryFile(dir=temp_dir) as temp_file:
-            temp_file.write(b"foobar")
-            with zipfile.ZipFile(f"{temp_dir}/compressed.zip", "w") as zip_file:
-                zip_file.write(temp_file.name)
-
-        yield Path(str(zip_file.filename))
-
-
-@fixture
-def create_temp_dir() -> Iterator[Path]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+FOO_RELEASE_CONFIG = config.ReleaseConfig(
+    amount_metrics=frozenset(),
+    create_torrent=False,
+    extensions_to_sign=frozenset(),
+    name="foo",
+    size_metrics=frozenset(),
+    version_metrics=frozenset(),
+)
 
 
 @fixture
-def create_temp_file() -> Iterator[Path]:
-    with tempfile.NamedTemporaryFile() as temp_file:
-        yield Path(temp_file.name)
+def create_temp_dir(tmp_path: Path) -> Iterator[Path]:
+    yield tmp_path
 
 
 @fixture
-def create_temp_dir_with_files() -> Iterator[Path]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with tempfile.TemporaryDirectory(dir=temp_dir) as inner_temp_dir:
-            with tempfile.NamedTemporaryFile(dir=inner_temp_dir, delete=False) as temp_file:
-                temp_file.write(b"foobar")
-            yield Path(inner_temp_dir)
+def create_temp_dir_with_files(tmp_path: Path) -> Iterator[Path]:
+    (tmp_path / "files").mkdir()
+    (tmp_path / "files/foo").write_bytes(b"foobar")
+    yield tmp_path / "files"
 
 
-@fixture
-def create_temp_metrics_file() -> Iterator[Path]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp_file:
-            temp_file.write(b"# TYPE version_info info\n")
-            temp_file.write(b"# HELP version_info Package description and version information\n")
-            temp_file.write(b'version_info{name="foo", description="Version of foo", version="1.0.0-1"} 1\n')
-            temp_file.write(b'version_info{name="bar", not_description="Version of bar", version="1.0.0-1"} 1\n')
-            temp_file.write(b"version_info 1\n")
-            temp_file.write(b'version{name="foo", description="Version of foo", version="1.0.0-1"} 1\n')
-            temp_file.write(b"# TYPE artifact_bytes gauge\n")
-            temp_file.write(b"# HELP artifact_bytes Artifact sizes in bytes\n")
-            temp_file.write(b'artifact_bytes{name="foo",description="Size of ISO image in MiB"} 832\n')
-            temp_file.write(b'artifact_bytes{not_name="foo",description="Size of ISO image in MiB"} 832\n')
-            temp_file.write(b"# TYPE data_count summary\n")
-            temp_file.write(b"# HELP data_count The amount of packages used in specific buildmodes\n")
-            temp_file.write(b'data_count{name="foo",description="The amount of packages in foo"} 369\n')
-            temp_file.write(b'data_count{not_name="netboot",description="something else"} 369\n')
-        yield Path(temp_file.name)
+@fixture(scope="session")
+def sample_release() -> Iterator[release.Release]:
+    yield release.Release(
+        name="foo",
+        version="1.0.0",
+        files=["foo", "bar", "baz"],
+        amount_metrics=[],
+        size_metrics=[],
+        version_metrics=[],
+        developer="Foobar McFoo",
+        torrent_file="foo-0.1.0.torrent",
+        pgp_public_key="SOMEONESKEY",
+    )
 
 
-@fixture
-def project_config() -> Iterator[config.ProjectConfig]:
+@fixture(scope="session")
+def _project_config() -> Iterator[config.ProjectConfig]:
     yield config.ProjectConfig(
         name="foo",
         job_name="bar",
-        output_dir="out",
-        metrics_file="metrics.txt",
+        output_dir=Path("out"),
+        metrics_file=Path("metrics.txt"),
         releases=[],
         sync_config=config.SyncConfig(),
     )
 
 
 @fixture
-def project_files(project_config: config.ProjectConfig) -> Iterator[files.ProjectFiles]:
+def project_config(_project_config: config.ProjectConfig) -> Iterator[config.ProjectConfig]:
+    # tests modify the project configuration, so each of them receives its own copy
+    yield _project_config.model_copy(deep=True)
+
+
+@fixture(scope="session")
+def release_type_templates() -> Iterator[Dict[str, Path]]:
+    # directory layouts shared by the sync directory tests, hardlinked into place by each test
+    with tempfile.TemporaryDirectory() as temp_dir:
+        current = Path(temp_dir) / "current/foo"
+        (current / "foo-0.1.0").mkdir(parents=True)
+        obsolete = Path(temp_dir) / "obsolete/foo"
+        (obsolete / "foo-0.1.0").mkdir(parents=True)
+        (obsolete / "foo-0.0.1").mkdir()
+        (obsolete / "foo-0.0.1/foo.txt").touch()
+        (obsolete / "foo-0.0.1.json").touch()
+        (obsolete / "foo-0.0.1.torrent").touch()
+        yield {"current": current, "obsolete": obsolete}
+
+
+def copy_release_type_template(template: Path, destination: Path) -> None:
+    shutil.copytree(template, destination, symlinks=True, copy_function=os.link)
+
+
+@fixture(scope="session")
+def _project_files(_project_config: config.ProjectConfig) -> Iterator[files.ProjectFiles]:
     with tempfile.TemporaryDirectory() as temp_dir:
         with patch("arch_release_promotion.files.Upstream.get_releases") as get_releases_mock:
-            settings_mock = Mock()
-            sync_dir = Path(temp_dir) / Path("foo")
-            settings_mock.GITLAB_URL = "https://foo.bar"
+            settings_mock = SimpleNamespace(GITLAB_URL="https://foo.bar")
             get_releases_mock.return_value = ["1.0.0", "1.0.1", "1.0.2"]
 
-            project_config.sync_config.directory = sync_dir  # type: ignore
-            yield files.ProjectFiles(
-                project_config=project_config,
-                settings=settings_mock,
+            project_files = files.ProjectFiles(
+                project_config=_project_config.model_copy(
+                    update={"sync_config": config.SyncConfig(directory=Path(temp_dir) / Path("foo"))}
+                ),
+                settings=settings_mock,  # type: ignore
             )
+        yield project_files
+
+
+@fixture
+def project_files(
+    _project_files: files.ProjectFiles,
+    project_config: config.ProjectConfig,
+    tmp_path: Path,
+) -> Iterator[files.ProjectFiles]:
+    # the Upstream instance is shared, while each test receives its own project configuration and sync directory
+    sync_dir = tmp_path / Path("foo")
+    sync_dir.mkdir()
+    project_config.sync_config = config.SyncConfig(directory=sync_dir)
+    yield _project_files.model_copy(
+        update={
+            "project_config": project_config,
+            "promoted_releases": list(_project_files.promoted_releases),
+        }
+    )
+    # pytest keeps tmp_path around after the test, so the synchronized files are removed right away
+    shutil.rmtree(sync_dir, ignore_errors=True)
 
 
 @mark.parametrize(
@@ -100,11 +133,10 @@ def project_files(project_config: config.ProjectConfig) -> Iterator[files.Projec
 )
 def test_files_in_dir(use_dir: bool, expectation: ContextManager[str]) -> None:
     with tempfile.TemporaryDirectory() as temp_dir:
-        tmp_file = tempfile.NamedTemporaryFile(suffix=".foo", dir=temp_dir, delete=False)
+        tmp_file = Path(temp_dir) / "x.foo"
+        tmp_file.touch()
         with expectation:
-            assert files.files_in_dir(path=Path(temp_dir) if use_dir else Path(tmp_file.name)) == [
-                Path(tmp_file.name).name
-            ]
+            assert files.files_in_dir(path=Path(temp_dir) if use_dir else tmp_file) == [tmp_file.name]
 
 
 @mark.parametrize(
@@ -117,31 +149,93 @@ def test_files_in_dir(use_dir: bool, expectation: ContextManager[str]) -> None:
 )
 def test_get_version_from_artifact_release_dir(use_dir: bool, version: str, expectation: ContextManager[str]) -> None:
     with tempfile.TemporaryDirectory(suffix=f"-{version}") as temp_dir:
-        tmp_file = tempfile.NamedTemporaryFile(suffix=".foo", dir=temp_dir, delete=False)
+        tmp_file = Path(temp_dir) / "x.foo"
+        tmp_file.touch()
         with expectation:
-            assert (
-                files.get_version_from_artifact_release_dir(path=Path(temp_dir) if use_dir else Path(tmp_file.name))
-                == version
-            )
+            assert files.get_version_from_artifact_release_dir(path=Path(temp_dir) if use_dir else tmp_file) == version
 
 
-def test_create_and_remove_temp_dir() -> None:
-    temp_dir = files.create_temp_dir()
-    assert isinstance(temp_dir, Path)
+def test_extract_zip_file(create_temp_zipfile: Path, tmp_path: Path) -> None:
     with raises(RuntimeError):
-        files.remove_temp_dir(Path("foo"))
+        files.extract_zip_file_to_parent_dir(path=Path("foo"))
+    (tmp_path / "broken.zip").write_bytes(b"foobar")
     with raises(RuntimeError):
-        files.remove_temp_dir(Path("/tmp"))
-
+        files.extract_zip_file_to_parent_dir(path=tmp_path / "broken.zip")
     with does_not_raise():
-        files.remove_temp_dir(temp_dir)
+        files.extract_zip_file_to_parent_dir(path=create_temp_zipfile)
+
 
+def test_extract_zip_file_contents(tmp_path: Path) -> None:
+    with zipfile.ZipFile(tmp_path / "compressed.zip", "w") as zip_file:
+        zip_file.writestr("foo/", "")
+        zip_file.writestr("foo/bar/baz.txt", b"foobar")
+    files.extract_zip_file_to_parent_dir(path=tmp_path / "compressed.zip")
+    assert (tmp_path / "foo").is_dir()
+    assert (tmp_path / "foo/bar/baz.txt").read_bytes() == b"foobar"
 
-def test_extract_zip_file(create_temp_zipfile: Path) -> None:
+    with zipfile.ZipFile(tmp_path / "many.zip", "w") as zip_file:
+        for i in range(files.ZIP_PARALLEL_EXTRACTION_THRESHOLD * 2):
+            zip_file.writestr(f"many/{i}.txt", f"{i}")
+    files.extract_zip_file_to_parent_dir(path=tmp_path / "many.zip")
+    for i in range(files.ZIP_PARALLEL_EXTRACTION_THRESHOLD * 2):
+        assert (tmp_path / f"many/{i}.txt").read_text() == f"{i}"
+
+    with zipfile.ZipFile(tmp_path / "outside.zip", "w") as zip_file:
+        zip_file.writestr("../baz.txt", b"foobar")
     with raises(RuntimeError):
-        files.extract_zip_file_to_parent_dir(path=Path("foo"))
-    with does_not_raise():
-        files.extract_zip_file_to_parent_dir(path=create_temp_zipfile)
+        files.extract_zip_file_to_parent_dir(path=tmp_path / "outside.zip")
+    assert not (tmp_path.parent / "baz.txt").exists()
+
+
+@mark.parametrize("copy_file_range_error", [None, errno.EXDEV, errno.EIO])
+def test__copy_file(copy_file_range_error: Optional[int], tmp_path: Path) -> None:
+    (tmp_path / "foo").write_bytes(b"foobar")
+    (tmp_path / "foo").chmod(0o640)
+    with patch(
+        "arch_release_promotion.files.os.copy_file_range",
+        side_effect=OSError(copy_file_range_error, "error") if copy_file_range_error else os.copy_file_range,
+    ):
+        with raises(OSError) if copy_file_range_error == errno.EIO else does_not_raise():
+            files._copy_file(src=tmp_path / "foo", dst=tmp_path / "bar")
+            assert (tmp_path / "bar").read_bytes() == b"foobar"
+            assert (tmp_path / "bar").stat().st_mode == (tmp_path / "foo").stat().st_mode
+
+
+@mark.parametrize("cross_device", [True, False])
+def test__move_file(cross_device: bool, tmp_path: Path) -> None:
+    (tmp_path / "foo").write_bytes(b"foobar")
+    with patch(
+        "arch_release_promotion.files.os.rename",
+        side_effect=OSError(errno.EXDEV, "cross-device link") if cross_device else os.rename,
+    ):
+        files._move_file(src=tmp_path / "foo", dst=tmp_path / "bar")
+    assert not (tmp_path / "foo").exists()
+    assert (tmp_path / "bar").read_bytes() == b"foobar"
+
+
+@mark.parametrize(
+    "extra_file, cross_device",
+    [
+        (False, False),
+        (True, False),
+        (False, True),
+    ],
+)
+def test__move_release_dir(extra_file: bool, cross_device: bool, tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src/foo").write_bytes(b"foo")
+    (tmp_path / "src/bar").write_bytes(b"bar")
+    if extra_file:
+        (tmp_path / "src/baz").write_bytes(b"baz")
+
+    with patch(
+        "arch_release_promotion.files.os.rename",
+        side_effect=OSError(errno.EXDEV, "cross-device link") if cross_device else os.rename,
+    ):
+        files._move_release_dir(src=tmp_path / "src", dst=tmp_path / "dst", files=["foo", "bar"])
+
+    assert sorted(os.listdir(tmp_path / "dst")) == ["bar", "foo"]
+    assert (tmp_path / "src").exists() == (extra_file or cross_device)
 
 
 @mark.parametrize(
@@ -171,52 +265,40 @@ def test_copy_signatures(
             files.copy_signatures(source=src_dir, destination=dst_dir)
 
 
-def test_write_release_info_to_file(create_temp_dir: Path) -> None:
+def test_write_release_info_to_file(create_temp_dir: Path, sample_release: release.Release) -> None:
     files.write_release_info_to_file(
-        release=release.Release(
-            name="foo",
-            version="1.0.0",
-            files=["foo", "bar", "baz"],
-            amount_metrics=[],
-            size_metrics=[],
-            version_metrics=[],
-            developer="Foobar McFoo",
-            torrent_file="foo-0.1.0.torrent",
-            pgp_public_key="SOMEONESKEY",
-        ),
+        release=sample_release,
         path=(create_temp_dir / Path("foo.json")),
     )
 
     with raises(IsADirectoryError):
         files.write_release_info_to_file(
-            release=release.Release(
-                name="foo",
-                version="1.0.0",
-                files=["foo", "bar", "baz"],
-                amount_metrics=[],
-                size_metrics=[],
-                version_metrics=[],
-                developer="Foobar McFoo",
-                torrent_file="foo-0.1.0.torrent",
-                pgp_public_key="SOMEONESKEY",
-            ),
+            release=sample_release,
             path=create_temp_dir,
         )
 
 
-def test_load_release_from_json_payload(create_temp_dir: Path) -> None:
-    file_path = create_temp_dir / Path("foo.json")
+def test_write_release_info_to_file_matches_model_dump(tmp_path: Path) -> None:
     release_type = release.Release(
         name="foo",
         version="1.0.0",
         files=["foo", "bar", "baz"],
-        amount_metrics=[],
-        size_metrics=[],
-        version_metrics=[],
+        amount_metrics=[release.AmountMetric(name="foo", description="Foo", amount=1)],
+        size_metrics=[release.SizeMetric(name="foo", description="Foo", size=1)],
+        version_metrics=[release.VersionMetric(name="foo", description="Foo", version="1.0.0")],
         developer="Foobar McFoo",
-        torrent_file="foo-0.1.0.torrent",
         pgp_public_key="SOMEONESKEY",
     )
+    files.write_release_info_to_file(release=release_type, path=tmp_path / "foo.json")
+    assert orjson.loads((tmp_path / "foo.json").read_bytes()) == release_type.model_dump()
+
+    with raises(TypeError):
+        files._serialize_model(object())
+
+
+def test_load_release_from_json_payload(create_temp_dir: Path, sample_release: release.Release) -> None:
+    file_path = create_temp_dir / Path("foo.json")
+    release_type = sample_release
     files.write_release_info_to_file(
         release=release_type,
         path=file_path,
@@ -247,10 +329,54 @@ def test_write_zip_file_to_parent_dir(
         assert (create_temp_dir_with_files.parent / Path(f"{name}.zip")).is_file()
 
 
+def test_load_release_from_json_payload_trusted(tmp_path: Path, sample_release: release.Release) -> None:
+    file_path = tmp_path / "foo.json"
+    files.write_release_info_to_file(release=sample_release, path=file_path)
+    assert files.load_release_from_json_payload(path=file_path, trusted=True).version == sample_release.version
+
+
+@mark.parametrize("amount", [0, 1, files.JSON_PARALLEL_LOAD_THRESHOLD + 1])
+def test_load_releases_from_json_payloads(amount: int, tmp_path: Path) -> None:
+    release_types = [
+        release.Release(
+            name=f"foo{i}",
+            version="1.0.0",
+            files=["foo", "bar", "baz"],
+            amount_metrics=[],
+            size_metrics=[],
+            version_metrics=[],
+            developer="Foobar McFoo",
+            pgp_public_key="SOMEONESKEY",
+        )
+        for i in range(amount)
+    ]
+    for release_type in release_types:
+        files.write_release_info_to_file(release=release_type, path=tmp_path / f"{release_type.name}.json")
+
+    assert (
+        files.load_releases_from_json_payloads(paths=[tmp_path / f"foo{i}.json" for i in range(amount)])
+        == release_types
+    )
+
+
+def test_write_zip_file_to_parent_dir_contents(tmp_path: Path) -> None:
+    (tmp_path / "promotion/foo").mkdir(parents=True)
+    (tmp_path / "promotion/foo/bar.txt").write_bytes(b"foobar")
+    (tmp_path / "promotion/foo/bar.txt.sig").write_bytes(b"signature")
+    files.write_zip_file_to_parent_dir(path=tmp_path / "promotion")
+    with zipfile.ZipFile(tmp_path / "promotion.zip") as zip_file:
+        assert zip_file.namelist() == ["foo/", "foo/bar.txt", "foo/bar.txt.sig"]
+        assert zip_file.getinfo("foo/bar.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert zip_file.getinfo("foo/bar.txt.sig").compress_type == zipfile.ZIP_STORED
+        assert zip_file.read("foo/bar.txt") == b"foobar"
+        assert zip_file.read("foo/bar.txt.sig") == b"signature"
+
+
 @mark.parametrize(
     "file_exists, version_metrics_names, size_metrics_names, amount_metrics_names",
     [
         (True, [], [], []),
+        (True, None, None, None),
         (False, [], [], []),
         (True, ["foo"], ["foo"], ["foo"]),
         (True, ["bar"], ["foo"], ["foo"]),
@@ -260,9 +386,9 @@ def test_write_zip_file_to_parent_dir(
 )
 def test_read_metrics_file(
     file_exists: bool,
-    version_metrics_names: List[str],
-    size_metrics_names: List[str],
-    amount_metrics_names: List[str],
+    version_metrics_names: Optional[List[str]],
+    size_metrics_names: Optional[List[str]],
+    amount_metrics_names: Optional[List[str]],
     create_temp_metrics_file: Path,
 ) -> None:
     metrics = files.read_metrics_file(
@@ -271,22 +397,59 @@ def test_read_metrics_file(
         size_metrics_names=size_metrics_names,
         amount_metrics_names=amount_metrics_names,
     )
-    if version_metrics_names == "foo":
+    if version_metrics_names == ["foo"]:
         assert len(metrics[2]) == 1
-    if size_metrics_names == "foo":
+    if size_metrics_names == ["foo"]:
         assert len(metrics[1]) == 1
-    if amount_metrics_names == "foo":
+    if amount_metrics_names == ["foo"]:
         assert len(metrics[0]) == 1
+    if not (version_metrics_names or size_metrics_names or amount_metrics_names):
+        assert metrics == ([], [], [])
 
 
-def test_files_create_dir(create_temp_dir: Path, create_temp_file: Path) -> None:
+@mark.parametrize(
+    "lines, samples",
+    [
+        ([], []),
+        (
+            ["# TYPE artifact_bytes gauge\n", 'artifact_bytes{name="foo",description="Foo"} 832\n'],
+            [("artifact_bytes", {"name": "foo", "description": "Foo"}, 832.0)],
+        ),
+        (
+            ["# TYPE artifact_bytes gauge\n", 'artifact_bytes{name="foo",description="Foo"} 8.32e2 1600000000\n'],
+            [("artifact_bytes", {"name": "foo", "description": "Foo"}, 832.0)],
+        ),
+        (["# TYPE artifact_bytes summary\n", 'artifact_bytes{name="foo",description="Foo"} 832\n'], []),
+        (['artifact_bytes{name="foo",description="Foo"} 832\n'], []),
+        (["# TYPE artifact_bytes gauge\n", 'artifact_bytes{name="foo",description="Foo"} foo\n'], []),
+        (["# TYPE artifact_bytes gauge\n", "artifact_bytes 832\n"], []),
+        (
+            [
+                "# TYPE version_info info\n",
+                'version_info{name="foo",description="A \\"quoted\\" {foo}\\\\n",version="1"} 1\n',
+            ],
+            [("version_info", {"name": "foo", "description": 'A "quoted" {foo}\\n', "version": "1"}, 1.0)],
+        ),
+        (
+            ["# TYPE data_count summary\n", 'data_count{name="foo",description="Line\\nbreak"} 369\n'],
+            [("data_count", {"name": "foo", "description": "Line\nbreak"}, 369.0)],
+        ),
+    ],
+)
+def test__read_metrics_samples(lines: List[str], samples: List[Tuple[str, Dict[str, str], float]]) -> None:
+    assert list(files._read_metrics_samples(lines=lines)) == samples
+
+
+def test_files_create_dir(tmp_path: Path) -> None:
+    temp_file = tmp_path / "f"
+    temp_file.touch()
     with raises(RuntimeError):
-        files.create_dir(path=create_temp_file)
+        files.create_dir(path=temp_file)
 
-    files.create_dir(path=create_temp_dir)
+    files.create_dir(path=tmp_path)
 
 
-@patch("arch_release_promotion.files.Settings")
+@patch("arch_release_promotion.files.UpstreamSettings")
 @patch("arch_release_promotion.files.Upstream.get_releases")
 def test_projectfiles(
     get_releases_mock: Mock,
@@ -298,7 +461,7 @@ def test_projectfiles(
         settings_mock.GITLAB_URL = "https://foo.bar"
         get_releases_mock.return_value = ["1.0.0", "1.0.1", "1.0.2"]
 
-        project_config.sync_config.directory = sync_dir  # type: ignore
+        project_config.sync_config = config.SyncConfig(directory=sync_dir)
         assert files.ProjectFiles(
             project_config=project_config,
             settings=settings_mock,
@@ -309,53 +472,45 @@ def test_projectfiles(
 @mark.parametrize(
     "create_tmp_in_sync_dir, sync_version_changes, set_latest_version_changes, remove_obsolete_changes",
     [
-        (True, True, True, True),
-        (True, True, True, False),
-        (True, True, False, True),
         (True, False, False, False),
-        (True, False, True, False),
-        (True, False, True, True),
-        (False, True, True, True),
-        (False, True, True, False),
-        (False, True, False, True),
+        (True, True, True, True),
         (False, False, False, False),
-        (False, False, True, False),
-        (False, False, True, True),
+        (False, True, True, True),
     ],
 )
-@patch("arch_release_promotion.files.Settings")
-@patch("arch_release_promotion.files.Upstream.get_releases")
-@patch("arch_release_promotion.files.Path")
-@patch("arch_release_promotion.files.ProjectFiles._sync_version")
-@patch("arch_release_promotion.files.ProjectFiles._set_latest_version_symlink")
-@patch("arch_release_promotion.files.ProjectFiles._remove_obsolete_releases")
-@patch("arch_release_promotion.files.ProjectFiles._set_last_update_file_timestamp")
 def test_projectfiles_sync(
-    _set_last_update_file_timestamp_mock: Mock,
-    _remove_obsolete_releases_mock: Mock,
-    _set_latest_version_symlink_mock: Mock,
-    _sync_version_mock: Mock,
-    path_mock: Mock,
-    get_releases_mock: Mock,
-    settings_mock: Mock,
     create_tmp_in_sync_dir: bool,
     sync_version_changes: bool,
     set_latest_version_changes: bool,
     remove_obsolete_changes: bool,
     project_config: config.ProjectConfig,
+    monkeypatch: MonkeyPatch,
 ) -> None:
     promoted_releases = ["1.0.0", "1.0.1", "1.0.2"]
     temp_dir_base = Path("foo")
-    path_mock.return_value = temp_dir_base
-    _sync_version_mock.return_value = sync_version_changes
-    _set_latest_version_symlink_mock.return_value = set_latest_version_changes
-    _remove_obsolete_releases_mock.return_value = remove_obsolete_changes
+    settings_mock = SimpleNamespace(GITLAB_URL="https://foo.bar")
+    _sync_version_mock = Mock(return_value=sync_version_changes)
+    _set_latest_version_symlink_mock = Mock(return_value=set_latest_version_changes)
+    _remove_obsolete_releases_mock = Mock(return_value=remove_obsolete_changes)
+    _set_last_update_file_timestamp_mock = Mock()
+    monkeypatch.setattr("arch_release_promotion.files.UpstreamSettings", Mock())
+    monkeypatch.setattr("arch_release_promotion.files.Upstream.get_releases", Mock(return_value=promoted_releases))
+    monkeypatch.setattr("arch_release_promotion.files.Path", Mock(return_value=temp_dir_base))
+    monkeypatch.setattr("arch_release_promotion.files.ProjectFiles._sync_version", _sync_version_mock)
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles._set_latest_version_symlink", _set_latest_version_symlink_mock
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles._remove_obsolete_releases", _remove_obsolete_releases_mock
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles._set_last_update_file_timestamp",
+        _set_last_update_file_timestamp_mock,
+    )
     with tempfile.TemporaryDirectory() as temp_dir:
         sync_dir = Path(temp_dir) / Path("foo")
-        settings_mock.GITLAB_URL = "https://foo.bar"
-        get_releases_mock.return_value = promoted_releases
 
-        project_config.sync_config.directory = sync_dir  # type: ignore
+        project_config.sync_config = config.SyncConfig(directory=sync_dir)
 
         if create_tmp_in_sync_dir:
             stale_tmp_dir = sync_dir / Path(".tmp-foo")
@@ -364,7 +519,7 @@ def test_projectfiles_sync(
 
         files.ProjectFiles.sync(
             project_config=project_config,
-            settings=settings_mock,
+            settings=settings_mock,  # type: ignore
         )
         assert sync_dir.exists() and sync_dir.is_dir()
         if create_tmp_in_sync_dir:
@@ -392,7 +547,9 @@ def test_projectfiles__set_last_update_file_timestamp(
 ) -> None:
     if has_last_updated_file:
         file = project_files.project_config.sync_config.directory / Path("foo")  # type: ignore
-        project_files.project_config.sync_config.last_updated_file = file  # type: ignore
+        project_files.project_config.sync_config = project_files.project_config.sync_config.model_copy(  # type: ignore
+            update={"last_updated_file": file}
+        )
 
     project_files._set_last_update_file_timestamp()
 
@@ -410,40 +567,30 @@ def test_projectfiles__remove_obsolete_releases(
     has_promoted_releases: bool,
     create_files: bool,
     project_files: files.ProjectFiles,
+    release_type_templates: Dict[str, Path],
 ) -> None:
     name = "foo"
     version = "0.1.0"
     other_version = "0.0.1"
     release_type_dir = project_files.project_config.sync_config.directory / Path(name)  # type: ignore
-    release_type_dir.mkdir()
-    version_dir = Path(f"{name}-{version}")
-    (release_type_dir / version_dir).mkdir()
+    copy_release_type_template(
+        template=release_type_templates["obsolete" if create_files else "current"],
+        destination=release_type_dir,
+    )
+    version_dir = f"{name}-{version}"
 
     if has_promoted_releases:
         project_files.promoted_releases = ["0.1.0"]
-        project_files.project_config.releases = [
-            config.ReleaseConfig(
-                **{
-                    "amount_metrics": [],
-                    "create_torrent": False,
-                    "extensions_to_sign": [],
-                    "name": name,
-                    "size_metrics": [],
-                    "version_metrics": [],
-                }
-            )
-        ]
+        project_files.project_config.releases = [FOO_RELEASE_CONFIG]
     else:
         project_files.promoted_releases = []
 
+    assert project_files._remove_obsolete_releases() == (has_promoted_releases and create_files)
+    assert os.path.isdir(f"{release_type_dir}/{version_dir}")
     if create_files:
-        other_version_dir = release_type_dir / Path(f"{name}-{other_version}")
-        other_version_dir.mkdir()
-        (other_version_dir / Path("foo.txt")).touch()
-        (release_type_dir / Path(f"{name}-{other_version}.json")).touch()
-        (release_type_dir / Path(f"{name}-{other_version}.torrent")).touch()
-
-    project_files._remove_obsolete_releases()
+        assert os.path.exists(f"{release_type_dir}/{name}-{other_version}") != has_promoted_releases
+        assert os.path.exists(f"{release_type_dir}/{name}-{other_version}.json") != has_promoted_releases
+        assert os.path.exists(f"{release_type_dir}/{name}-{other_version}.torrent") != has_promoted_releases
 
 
 @mark.parametrize(
@@ -453,6 +600,7 @@ def test_projectfiles__remove_obsolete_releases(
         (True, "same_version"),
         (True, "file"),
         (True, "dir"),
+        (True, "regular_file"),
         (True, None),
         (False, "other_version"),
         (False, "same_version"),
@@ -465,30 +613,19 @@ def test_projectfiles__set_latest_version_symlink(
     has_promoted_releases: bool,
     link_target: str,
     project_files: files.ProjectFiles,
+    release_type_templates: Dict[str, Path],
 ) -> None:
     name = "foo"
     version = "0.1.0"
     other_version = "0.0.1"
     release_type_dir = project_files.project_config.sync_config.directory / Path(name)  # type: ignore
-    release_type_dir.mkdir()
+    copy_release_type_template(template=release_type_templates["current"], destination=release_type_dir)
     latest_path = release_type_dir / Path("latest")
     version_dir = Path(f"{name}-{version}")
-    (release_type_dir / version_dir).mkdir()
 
     if has_promoted_releases:
         project_files.promoted_releases = ["0.1.0"]
-        project_files.project_config.releases = [
-            config.ReleaseConfig(
-                **{
-                    "amount_metrics": [],
-                    "create_torrent": False,
-                    "extensions_to_sign": [],
-                    "name": name,
-                    "size_metrics": [],
-                    "version_metrics": [],
-                }
-            )
-        ]
+        project_files.project_config.releases = [FOO_RELEASE_CONFIG]
     else:
         project_files.promoted_releases = []
 
@@ -504,6 +641,8 @@ def test_projectfiles__set_latest_version_symlink(
         latest_path.symlink_to(other_dir)
     if link_target == "dir":
         latest_path.mkdir()
+    if link_target == "regular_file":
+        latest_path.touch()
 
     project_files._set_latest_version_symlink()
     if has_promoted_releases:
@@ -519,44 +658,46 @@ def test_projectfiles__set_latest_version_symlink(
         (False, False),
     ],
 )
-@patch("arch_release_promotion.files.Path")
-@patch("arch_release_promotion.files.Upstream.download_promotion_artifact")
-@patch("arch_release_promotion.files.extract_zip_file_to_parent_dir")
-@patch("arch_release_promotion.files.ProjectFiles._project_version_requires_sync")
-@patch("arch_release_promotion.files.Upstream.download_release")
-@patch("arch_release_promotion.files.load_release_from_json_payload")
-@patch("arch_release_promotion.files.ProjectFiles.copy_release_type_promotion_artifacts_to_build_dir")
-@patch("arch_release_promotion.files.ProjectFiles.validate_release_type_files")
-@patch("arch_release_promotion.files.ProjectFiles.move_release_type_to_sync_dir")
 def test_projectfiles__sync_version(
-    move_release_type_to_sync_dir_mock: Mock,
-    validate_release_type_files_mock: Mock,
-    copy_release_type_promotion_artifacts_to_build_dir_mock: Mock,
-    load_release_from_json_payload_mock: Mock,
-    download_release_mock: Mock,
-    _project_version_requires_sync_mock: Mock,
-    extract_zip_file_to_parent_dir_mock: Mock,
-    download_promotion_artifact_mock: Mock,
-    path_mock: Mock,
     requires_sync: bool,
     create_json_files: bool,
     create_temp_dir: Path,
     project_files: files.ProjectFiles,
+    monkeypatch: MonkeyPatch,
 ) -> None:
     version = "0.1.0"
     promotion_temp_dir = create_temp_dir / Path("promotion")
     build_temp_dir = create_temp_dir / Path("build")
     promotion_temp_dir.mkdir()
     build_temp_dir.mkdir()
-    path_mock.side_effect = [promotion_temp_dir, build_temp_dir]
-
     promotion_artifact = promotion_temp_dir / Path("promotion.zip")
-    download_promotion_artifact_mock.return_value = promotion_artifact
-
-    _project_version_requires_sync_mock.return_value = requires_sync
-
     build_artifact = build_temp_dir / Path("output.zip")
-    download_release_mock.return_value = build_artifact
+    extract_zip_file_to_parent_dir_mock = Mock()
+    copy_release_type_promotion_artifacts_to_build_dir_mock = Mock()
+    validate_release_type_files_mock = Mock()
+    move_release_type_to_sync_dir_mock = Mock()
+    monkeypatch.setattr("arch_release_promotion.files.Path", Mock(side_effect=[promotion_temp_dir, build_temp_dir]))
+    monkeypatch.setattr(
+        "arch_release_promotion.files.Upstream.download_promotion_artifact", Mock(return_value=promotion_artifact)
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.extract_zip_file_to_parent_dir", extract_zip_file_to_parent_dir_mock
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles._project_version_requires_sync", Mock(return_value=requires_sync)
+    )
+    monkeypatch.setattr("arch_release_promotion.files.Upstream.download_release", Mock(return_value=build_artifact))
+    monkeypatch.setattr("arch_release_promotion.files.load_release_from_json_payload", Mock())
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles.copy_release_type_promotion_artifacts_to_build_dir",
+        copy_release_type_promotion_artifacts_to_build_dir_mock,
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles.validate_release_type_files", validate_release_type_files_mock
+    )
+    monkeypatch.setattr(
+        "arch_release_promotion.files.ProjectFiles.move_release_type_to_sync_dir", move_release_type_to_sync_dir_mock
+    )
 
     if create_json_files:
         (promotion_temp_dir / Path("foo")).mkdir()
@@ -592,29 +733,24 @@ def test_projectfiles__is_release_type_synced(
     create_release_file: bool,
     return_value: bool,
     project_files: files.ProjectFiles,
+    sample_release: release.Release,
 ) -> None:
     name = "foo"
     version = "0.1.0"
     file = "foo.txt"
 
-    (project_files.project_config.sync_config.directory / Path(f"{name}")).mkdir(parents=True)  # type: ignore
+    base = f"{project_files.project_config.sync_config.directory}/{name}"  # type: ignore
+    os.makedirs(base)
     if create_json:
-        (
-            project_files.project_config.sync_config.directory / Path(f"{name}/{name}-{version}.json")  # type: ignore
-        ).touch()
+        open(f"{base}/{name}-{version}.json", "w").close()
 
     load_release_from_json_payload_mock.return_value = (
-        files.Release(
-            **{
-                "name": name,
+        sample_release.model_copy(
+            update={
                 "version": version,
                 "files": [file],
-                "amount_metrics": [],
-                "size_metrics": [],
-                "version_metrics": [],
                 "torrent_file": f"{name}-{version}.torrent" if has_torrent else None,
                 "developer": "Foobar McFooface <foobar@mcfooface.com>",
-                "pgp_public_key": "SOMEONESKEY",
             }
         )
         if create_json
@@ -622,18 +758,11 @@ def test_projectfiles__is_release_type_synced(
     )
 
     if create_torrent_file:
-        (
-            project_files.project_config.sync_config.directory  # type: ignore
-            / Path(f"{name}/{name}-{version}.torrent")
-        ).touch()
+        open(f"{base}/{name}-{version}.torrent", "w").close()
 
     if create_release_file:
-        (project_files.project_config.sync_config.directory / Path(f"{name}/{name}-{version}")).mkdir(  # type: ignore
-            parents=True
-        )
-        (
-            project_files.project_config.sync_config.directory / Path(f"{name}/{name}-{version}/{file}")  # type: ignore
-        ).touch()
+        os.mkdir(f"{base}/{name}-{version}")
+        open(f"{base}/{name}-{version}/{file}", "w").close()
 
     assert project_files._is_release_type_synced(name=name, version=version) is return_value
 
@@ -655,21 +784,9 @@ def test_projectfiles__project_version_requires_sync(
     return_value: bool,
     project_files: files.ProjectFiles,
 ) -> None:
-    name = "foo"
     version = "0.1.0"
     if has_release_type:
-        project_files.project_config.releases = [
-            config.ReleaseConfig(
-                **{
-                    "amount_metrics": [],
-                    "create_torrent": False,
-                    "extensions_to_sign": [],
-                    "name": name,
-                    "size_metrics": [],
-                    "version_metrics": [],
-                }
-            )
-        ]
+        project_files.project_config.releases = [FOO_RELEASE_CONFIG]
 
     _is_release_type_synced_mock.return_value = release_type_synced
 
@@ -681,20 +798,11 @@ def test_projectfiles_copy_release_type_promotion_artifacts_to_build_dir(
     torrent_file: bool,
     create_temp_dir: Path,
     project_files: files.ProjectFiles,
+    sample_release: release.Release,
 ) -> None:
     torrent_file_name = "foo-1.0.0.torrent"
     release_dir_name = "foo-1.0.0"
-    release_type = release.Release(
-        name="foo",
-        version="1.0.0",
-        files=["foo", "bar", "baz"],
-        amount_metrics=[],
-        size_metrics=[],
-        version_metrics=[],
-        developer="Foobar McFoo",
-        torrent_file=torrent_file_name if torrent_file else None,
-        pgp_public_key="SOMEONESKEY",
-    )
+    release_type = sample_release.model_copy(update={"torrent_file": torrent_file_name if torrent_file else None})
     source_base = create_temp_dir / Path("source")
     (source_base / Path(f"foo/{release_dir_name}")).mkdir(parents=True)
     (source_base / Path("foo/foo-1.0.0.json")).touch()
@@ -728,20 +836,11 @@ def test_projectfiles_validate_release_type_files(
     expectation: ContextManager[str],
     create_temp_dir: Path,
     project_files: files.ProjectFiles,
+    sample_release: release.Release,
 ) -> None:
     torrent_file_name = "foo-1.0.0.torrent"
     release_dir_name = "foo-1.0.0"
-    release_type = release.Release(
-        name="foo",
-        version="1.0.0",
-        files=["foo", "bar", "baz"],
-        amount_metrics=[],
-        size_metrics=[],
-        version_metrics=[],
-        developer="Foobar McFoo",
-        torrent_file=torrent_file_name if require_torrent else None,
-        pgp_public_key="SOMEONESKEY",
-    )
+    release_type = sample_release.model_copy(update={"torrent_file": torrent_file_name if require_torrent else None})
     (create_temp_dir / Path(f"foo/{release_dir_name}")).mkdir(parents=True)
 
     if create_json:
@@ -773,26 +872,23 @@ def test_projectfiles_move_release_type_to_sync_dir(
     create_destination_as_dir: bool,
     create_temp_dir: Path,
     project_files: files.ProjectFiles,
+    sample_release: release.Release,
 ) -> None:
     torrent_file_name = "foo-1.0.0.torrent"
     release_dir_name = "foo-1.0.0"
-    release_type = release.Release(
-        name="foo",
-        version="1.0.0",
-        files=["foo", "bar", "baz"],
-        amount_metrics=[],
-        size_metrics=[],
-        version_metrics=[],
-        developer="Foobar McFoo <foobar@mcfooface.com>",
-        torrent_file=torrent_file_name if has_torrent else None,
-        pgp_public_key="SOMEONESKEY",
+    release_type = sample_release.model_copy(
+        update={
+            "developer": "Foobar McFoo <foobar@mcfooface.com>",
+            "torrent_file": torrent_file_name if has_torrent else None,
+        }
     )
     source_base = create_temp_dir / Path("source")
     sync_dir = create_temp_dir / Path("sync_dir")
 
-    (source_base / Path(f"foo/{release_dir_name}")).mkdir(parents=True)
+    release_dir = f"{source_base}/foo/{release_dir_name}"
+    os.makedirs(release_dir)
     for file in release_type.files:
-        (source_base / Path(f"foo/{release_dir_name}/{file}")).touch()
+        os.close(os.open(f"{release_dir}/{file}", os.O_WRONLY | os.O_CREAT, 0o644))
     (source_base / Path(f"foo/{release_dir_name}.json")).touch()
 
     if has_torrent:
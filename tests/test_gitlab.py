@@ -1,13 +1,56 @@
+import copy
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
-from typing import ContextManager, Optional
-from unittest.mock import Mock, patch
+from typing import ContextManager, Iterator, Optional
+from unittest.mock import MagicMock, Mock, patch
 
 from gitlab.exceptions import GitlabGetError
-from pytest import mark, raises
+from pytest import fixture, mark, raises
 
 from arch_release_promotion import gitlab
 
+# a projects stub for tests, that only exercise a code path and never inspect the mock
+NOOP_PROJECTS = Mock(return_value=Mock())
+
+
+def create_projects_mock(
+    releases_available: bool,
+    tag_name: str,
+    link_name: str,
+    link_url: str = "https://foo.bar/download/this/file.zip",
+    multi: bool = False,
+) -> Mock:
+    release = Mock()
+    release.attributes = {"assets": {"links": [{"name": link_name, "url": link_url}] * (2 if multi else 1)}}
+    release.tag_name = tag_name
+
+    project = Mock()
+    if releases_available:
+        project.releases.list.return_value = [release]
+        project.releases.get.return_value = release
+    else:
+        project.releases.list.return_value = []
+        project.releases.get.side_effect = GitlabGetError
+
+    projects = Mock()
+    projects.get.return_value = project
+    return projects
+
+
+@fixture(scope="module")
+def _upstream() -> Iterator[gitlab.Upstream]:
+    yield gitlab.Upstream(
+        url="https://foo.bar-mc.foo",
+        private_token="THISISAFAKETOKEN",
+        name="foo/bar",
+    )
+
+
+@fixture
+def upstream(_upstream: gitlab.Upstream) -> Iterator[gitlab.Upstream]:
+    # tests replace the projects, project and session attributes, so each of them receives its own shallow copy
+    yield copy.copy(_upstream)
+
 
 @mark.parametrize(
     "name",
@@ -40,31 +83,13 @@ def test_gitlab_select_release(
     tag_name: str,
     link_name: str,
     output: Optional[str],
+    upstream: gitlab.Upstream,
 ) -> None:
-    upstream = gitlab.Upstream(
-        url="https://foo.bar-mc.foo",
-        private_token="THISISAFAKETOKEN",
-        name="foo/bar",
+    upstream.projects = create_projects_mock(
+        releases_available=releases_available,
+        tag_name=tag_name,
+        link_name=link_name,
     )
-
-    link = Mock()
-    link.name = link_name
-    links = Mock()
-    links.list.return_value = [link]
-
-    release = Mock()
-    release.links = links
-    release.tag_name = tag_name
-
-    releases = Mock()
-    releases.list.return_value = [release] if releases_available else []
-
-    project = Mock()
-    project.releases = releases
-
-    projects = Mock()
-    projects.get.return_value = project
-    upstream.projects = projects
     assert upstream.select_release() == output
 
 
@@ -77,6 +102,7 @@ def test_gitlab_select_release(
         (False, "0.1.0", "Promotion artifact", 1, False, []),
         (True, "0.1.0", "Promotion artifact", 1, True, ["0.1.0"]),
         (True, "0.1.0", "Build artifacts", 1, True, []),
+        (True, "0.1.0", "Build artifacts", 0, False, []),
     ],
 )
 def test_gitlab_get_releases(
@@ -86,137 +112,142 @@ def test_gitlab_get_releases(
     max_releases: bool,
     promoted: bool,
     output: Optional[str],
+    upstream: gitlab.Upstream,
 ) -> None:
-    upstream = gitlab.Upstream(
-        url="https://foo.bar-mc.foo",
-        private_token="THISISAFAKETOKEN",
-        name="foo/bar",
+    upstream.projects = create_projects_mock(
+        releases_available=releases_available,
+        tag_name=tag_name,
+        link_name=link_name,
     )
-    link = Mock()
-    link.name = link_name
-    links = Mock()
-    links.list.return_value = [link]
+    assert upstream.get_releases(max_releases=max_releases, promoted=promoted) == output
 
-    release = Mock()
-    release.links = links
-    release.tag_name = tag_name
 
-    releases = Mock()
-    releases.list.return_value = [release] if releases_available else []
+def test_gitlab_get_releases_stops_at_max_releases(upstream: gitlab.Upstream) -> None:
+    releases = []
+    for tag_name in ["0.3.0", "0.2.0", "0.1.0"]:
+        release = Mock()
+        release.attributes = {"assets": {"links": []}}
+        release.tag_name = tag_name
+        releases += [release]
 
     project = Mock()
-    project.releases = releases
-
+    project.releases.list.return_value = iter(releases)
     projects = Mock()
     projects.get.return_value = project
     upstream.projects = projects
-    assert upstream.get_releases(max_releases=max_releases, promoted=promoted) == output
 
+    assert upstream.get_releases(max_releases=2) == ["0.3.0", "0.2.0"]
+    project.releases.list.assert_called_once_with(iterator=True)
+    assert [release.tag_name for release in project.releases.list.return_value] == ["0.1.0"]
 
-def test_gitlab_download_release() -> None:
-    upstream = gitlab.Upstream(
-        url="https://foo.bar-mc.foo",
-        private_token="THISISAFAKETOKEN",
-        name="foo/bar",
-    )
-    upstream.projects = Mock(return_value=Mock())
+
+def test_gitlab_project_cached(upstream: gitlab.Upstream) -> None:
+    upstream.projects = Mock()
+    assert upstream.project is upstream.project
+    upstream.projects.get.assert_called_once_with("foo/bar")
+
+
+def test_gitlab_download_release(tmp_path: Path, upstream: gitlab.Upstream) -> None:
+    upstream.projects = NOOP_PROJECTS
     upstream.download_release(tag_name="0.1.0", temp_dir=Path("/tmp"), job_name="job")
 
+    project = Mock()
+    project.artifacts = Mock(side_effect=lambda action, **kwargs: [action(b"foo"), action(b"bar")])
+    upstream.project = project
+    assert upstream.download_release(tag_name="0.1.0", temp_dir=tmp_path, job_name="job").read_bytes() == b"foobar"
+    assert project.artifacts.call_args.kwargs["chunk_size"] == gitlab.DOWNLOAD_CHUNK_SIZE
+
     project = Mock()
     project.artifacts = Mock(side_effect=GitlabGetError)
-    projects = Mock()
-    projects.get.return_value = project
-    upstream.projects = projects
+    upstream.project = project
     upstream.download_release(tag_name="0.1.0", temp_dir=Path("/tmp"), job_name="job")
 
 
 @mark.parametrize(
-    "releases_available, tag_name, multi_promotion, has_link, link_name, link_url, expectation",
+    "link_url",
     [
-        (True, "0.1.0", False, True, "Promotion artifact", "https://foo.bar/download/this/file.zip", does_not_raise()),
-        (True, "0.1.0", False, True, "Foo artifact", "https://foo.bar/download/this/file.zip", raises(RuntimeError)),
-        (
-            False,
-            "0.1.0",
-            False,
-            True,
-            "Promotion artifact",
-            "https://foo.bar/download/this/file.zip",
-            raises(RuntimeError),
-        ),
-        (
-            True,
-            "0.1.0",
-            True,
-            True,
-            "Promotion artifact",
-            "https://foo.bar/download/this/file.zip",
-            raises(RuntimeError),
-        ),
+        ("https://foo.bar/download/this/file.zip"),
+        ("https://foo.bar-mc.foo/foo/bar/uploads/file.zip"),
     ],
 )
-@patch("arch_release_promotion.gitlab.request.urlretrieve")
-def test_gitlab_download_promotion_artifact(
-    urlretrieve_mock: Mock,
+def test_gitlab_download_promotion_artifact(link_url: str, tmp_path: Path, upstream: gitlab.Upstream) -> None:
+    upstream.projects = create_projects_mock(
+        releases_available=True,
+        tag_name="0.1.0",
+        link_name="Promotion artifact",
+        link_url=link_url,
+    )
+    upstream.session = MagicMock()
+    response = upstream.session.get.return_value.__enter__.return_value
+    response.iter_content.return_value = [b"foo", b"bar"]
+
+    assert upstream.download_promotion_artifact(tag_name="0.1.0", temp_dir=tmp_path).read_bytes() == b"foobar"
+    upstream.session.get.assert_called_once_with(
+        link_url,
+        headers=upstream.headers if link_url.startswith(upstream.url) else None,
+        timeout=gitlab.DOWNLOAD_TIMEOUT,
+        stream=True,
+    )
+    response.raise_for_status.assert_called_once()
+
+
+@mark.parametrize(
+    "releases_available, multi_promotion, link_name",
+    [
+        (True, False, "Foo artifact"),
+        (False, False, "Promotion artifact"),
+        (True, True, "Promotion artifact"),
+    ],
+)
+def test_gitlab_download_promotion_artifact_raises(
     releases_available: bool,
-    tag_name: str,
     multi_promotion: bool,
-    has_link: bool,
     link_name: str,
-    link_url: str,
-    expectation: ContextManager[str],
+    tmp_path: Path,
+    upstream: gitlab.Upstream,
 ) -> None:
-    urlretrieve_mock.return_value = ("foo", None)
-    upstream = gitlab.Upstream(
-        url="https://foo.bar-mc.foo",
-        private_token="THISISAFAKETOKEN",
-        name="foo/bar",
+    upstream.projects = create_projects_mock(
+        releases_available=releases_available,
+        tag_name="0.1.0",
+        link_name=link_name,
+        multi=multi_promotion,
     )
-    link = Mock()
-    link.name = link_name
-    link.url = link_url
-    links = Mock()
-    links.list.return_value = [link]
-
-    release = Mock()
-    release.links = links
-    release.tag_name = tag_name
+    upstream.session = Mock()
 
-    releases = Mock()
-    releases.list.return_value = [release] if releases_available else []
-    if releases_available and multi_promotion:
-        releases.list.return_value = [release, release]
-
-    project = Mock()
-    project.releases = releases
+    with raises(RuntimeError):
+        upstream.download_promotion_artifact(tag_name="0.1.0", temp_dir=tmp_path)
+    upstream.session.get.assert_not_called()
 
-    projects = Mock()
-    projects.get.return_value = project
-    upstream.projects = projects
-
-    with expectation:
-        upstream.download_promotion_artifact(tag_name="0.1.0", temp_dir=Path("/tmp"))
-        urlretrieve_mock.assert_called_once_with(link_url, filename=Path("/tmp") / Path("promotion.zip"))
-
-
-@mark.parametrize("same_tag_name", [(True), (False)])
-def test_gitlab_promote_release(same_tag_name: bool) -> None:
-    upstream = gitlab.Upstream(
-        url="https://foo.bar-mc.foo",
-        private_token="THISISAFAKETOKEN",
-        name="foo/bar",
-    )
 
+@mark.parametrize(
+    "release_available, expectation",
+    [
+        (True, does_not_raise()),
+        (False, raises(RuntimeError)),
+    ],
+)
+def test_gitlab_promote_release(
+    release_available: bool,
+    expectation: ContextManager[str],
+    upstream: gitlab.Upstream,
+) -> None:
     release = Mock()
-    release.tag_name = "0.1.0" if same_tag_name else "0.2.0"
     releases = Mock()
-    releases.list.return_value = [release]
+    if release_available:
+        releases.get.return_value = release
+    else:
+        releases.get.side_effect = GitlabGetError
 
     project = Mock()
     project.upload.return_value = {"url": "uploaded"}
     project.releases = releases
+    upstream.project = project
 
-    projects = Mock()
-    projects.get.return_value = project
-    upstream.projects = projects
-    upstream.promote_release(tag_name="0.1.0", file="file")
+    with expectation:
+        upstream.promote_release(tag_name="0.1.0", file="file")
+        releases.get.assert_called_once_with("0.1.0")
+        release.links.create.assert_called_once_with(
+            {"url": "https://foo.bar-mc.foo/foo/bar/uploaded", "name": "Promotion artifact"}
+        )
+    if not release_available:
+        project.upload.assert_not_called()
@@ -1,35 +1,29 @@
-from arch_release_promotion import release
-
-
-def test_metric() -> None:
-    assert release.Metric(
-        name="foo",
-        description="bar",
-    )
-
-
-def test_amount_metric() -> None:
-    assert release.AmountMetric(
-        name="foo",
-        description="bar",
-        amount=1,
-    )
+from typing import Any, Dict, Type
 
+from pydantic import ValidationError
+from pytest import mark, raises
 
-def test_size_metric() -> None:
-    assert release.SizeMetric(
-        name="foo",
-        description="bar",
-        size=1.1,
-    )
+from arch_release_promotion import release
 
 
-def test_version_metric() -> None:
-    assert release.VersionMetric(
-        name="foo",
-        description="bar",
-        version="1.0.0-1",
-    )
+@mark.parametrize(
+    "cls, kwargs",
+    [
+        (release.Metric, {"name": "foo", "description": "bar"}),
+        (release.AmountMetric, {"name": "foo", "description": "bar", "amount": 1}),
+        (release.SizeMetric, {"name": "foo", "description": "bar", "size": 1}),
+        (release.VersionMetric, {"name": "foo", "description": "bar", "version": "1.0.0-1"}),
+    ],
+)
+def test_metric(cls: Type[release.Metric], kwargs: Dict[str, Any]) -> None:
+    assert cls(**kwargs)
+
+
+def test_metric_frozen() -> None:
+    metric = release.SizeMetric(name="foo", description="bar", size=1)
+    with raises(ValidationError):
+        metric.size = 2  # type: ignore
+    assert hash(metric) == hash(release.SizeMetric(name="foo", description="bar", size=1))
 
 
 def test_release() -> None:
@@ -1,29 +1,101 @@
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext as does_not_raise
 from pathlib import Path
+from threading import Lock
+from typing import ContextManager, List
 from unittest.mock import Mock, call, patch
 
+from pytest import mark, raises
+
 from arch_release_promotion import signature
 
+DEVELOPER = "foo bar <foo@bar.baz>"
+GPGKEY = "somefakekey"
+
 
 @patch("arch_release_promotion.signature.sign_file")
-def test_sign_files_in_dir(sign_file_mock: Mock) -> None:
-    developer = "foo bar <foo@bar.baz>"
-    gpgkey = "somefakekey"
+@patch("arch_release_promotion.signature.Path.iterdir")
+def test_sign_files_in_dir(iterdir_mock: Mock, sign_file_mock: Mock) -> None:
     sign_file_mock.return_value = 0
+    extensions = [".bar", ".baz"]
+    paths = [Path("/tmp/b.baz"), Path("/tmp/a.bar")]
+    iterdir_mock.return_value = [*paths, Path("/tmp/c.foo")]
+
+    signature.sign_files_in_dir(path=Path("/tmp"), developer=DEVELOPER, gpgkey=GPGKEY, file_extensions=extensions)
+    sign_file_mock.assert_has_calls(
+        calls=[call(path=path, developer=DEVELOPER, gpgkey=GPGKEY) for path in sorted(paths)],
+        any_order=True,
+    )
+    assert sign_file_mock.call_count == len(extensions)
+
+
+@patch("arch_release_promotion.signature.sign_file")
+def test_sign_files_in_dir_shared_limit(sign_file_mock: Mock, tmp_path: Path) -> None:
+    lock = Lock()
+    running = [0, 0]
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        tempfile.NamedTemporaryFile(suffix=".foo", dir=temp_dir, delete=False)
-        extensions = [".bar", ".baz"]
-        for suffix in extensions:
-            tempfile.NamedTemporaryFile(suffix=suffix, dir=temp_dir, delete=False)
+    def sign_file(path: Path, developer: str, gpgkey: str) -> int:
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return 0
 
-        signature.sign_files_in_dir(path=Path(temp_dir), developer=developer, gpgkey=gpgkey, file_extensions=extensions)
+    sign_file_mock.side_effect = sign_file
+    paths = [tmp_path / str(release) for release in range(3)]
+    for path in paths:
+        path.mkdir()
+        for index in range(signature.SIGN_MAX_WORKERS):
+            (path / f"{index}.foo").touch()
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = [
+            executor.submit(
+                signature.sign_files_in_dir,
+                path=path,
+                developer=DEVELOPER,
+                gpgkey=GPGKEY,
+                file_extensions=[".foo"],
+            )
+            for path in paths
+        ]
+        for future in futures:
+            future.result()
+
+    assert sign_file_mock.call_count == len(paths) * signature.SIGN_MAX_WORKERS
+    assert running[1] <= signature.SIGN_MAX_WORKERS
+
+
+@mark.parametrize(
+    "return_codes, expectation",
+    [
+        ([0], does_not_raise()),
+        ([2, 2, 0], does_not_raise()),
+        ([2, 2, 2], raises(RuntimeError)),
+    ],
+)
+@patch("arch_release_promotion.signature.time.sleep")
+@patch("arch_release_promotion.signature.sign_file")
+def test__sign_file_with_retries(
+    sign_file_mock: Mock,
+    sleep_mock: Mock,
+    return_codes: List[int],
+    expectation: ContextManager[str],
+) -> None:
+    sign_file_mock.side_effect = return_codes
+    with expectation:
+        signature._sign_file_with_retries(path=Path("/foo/bar.baz"), developer=DEVELOPER, gpgkey=GPGKEY)
+    assert sign_file_mock.call_count == len(return_codes)
+    sleep_mock.assert_has_calls(
+        [call(signature.SIGN_RETRY_DELAY * 2**attempt) for attempt in range(len(return_codes) - 1)]
+    )
 
 
-@patch("arch_release_promotion.signature.run")
+@patch("arch_release_promotion.signature.run", autospec=True)
 def test_sign_file(run_mock: Mock) -> None:
-    developer = "foo bar <foo@bar.baz>"
-    gpgkey = "somefakekey"
     path = Path("/foo/bar.baz")
     calls = [
         call(
@@ -33,13 +105,13 @@ def test_sign_file(run_mock: Mock) -> None:
                 "--no-armor",
                 "--no-include-key-block",
                 "--sender",
-                developer,
+                DEVELOPER,
                 "--default-key",
-                gpgkey,
+                GPGKEY,
                 "--detach-sign",
                 str(path),
             ]
         )
     ]
-    signature.sign_file(path=path, developer=developer, gpgkey=gpgkey)
+    signature.sign_file(path=path, developer=DEVELOPER, gpgkey=GPGKEY)
     run_mock.assert_has_calls(calls=calls, any_order=True)
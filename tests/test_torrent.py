@@ -1,25 +1,110 @@
+import os
+from contextlib import nullcontext as does_not_raise
+from io import BytesIO
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from typing import ContextManager, List
+from unittest.mock import Mock, call, patch
+
+from pytest import mark, raises
+from requests import ConnectionError, Response, Timeout
+from torrentool.api import Torrent
 
 from arch_release_promotion import torrent
 
+MIRRORLIST_BASIC = (
+    b"# foo bar baz\n" b"#Server = https://foo.bar/$repo/os/$arch\n" b"# #Server = https://baz.bar/$repo/os/$arch\n"
+)
+MIRRORLIST_MULTIPLE = (
+    b"## Worldwide\n"
+    b"#Server = https://foo.bar/$repo/os/$arch\n"
+    b"Server = https://enabled.bar/$repo/os/$arch\n"
+    b"\n"
+    b"## Germany\n"
+    b"#Server = https://baz.bar/arch/$repo/os/$arch\n"
+)
+MIRRORLIST_EMPTY = b""
+
+
+def create_mirrorlist_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = BytesIO(content)
+    return response
+
+
+@mark.parametrize("single_file", [(True), (False)])
+def test_create_torrent_file(tmp_path: Path, single_file: bool) -> None:
+    (tmp_path / "foo/bar").mkdir(parents=True)
+    (tmp_path / "foo/a.iso").write_bytes(os.urandom(torrent.TORRENT_PIECE_LENGTH * 3 + 5))
+    (tmp_path / "foo/a.iso.sig").write_bytes(os.urandom(566))
+    (tmp_path / "foo/empty").touch()
+    (tmp_path / "foo/bar/b.img").write_bytes(os.urandom(torrent.TORRENT_PIECE_LENGTH * 70))
+    path = tmp_path / "foo/a.iso" if single_file else tmp_path / "foo"
+
+    assert torrent.create_torrent_file(path=path, webseeds=["https://foo.bar/"], output=tmp_path / "foo.torrent") == (
+        "foo.torrent"
+    )
+    created = Torrent.from_file(tmp_path / "foo.torrent")
+    assert created.webseeds == ["https://foo.bar/"]
+    assert created._struct["info"] == Torrent.create_from(path)._struct["info"]
 
-@patch("arch_release_promotion.torrent.Torrent.create_from")
-def test_creat_torrent_file(create_from_mock: Mock) -> None:
-    torrent.create_torrent_file(path=Path("foo"), webseeds=["foo"], output=Path("bar"))
 
+def test_create_torrent_file_empty(tmp_path: Path) -> None:
+    (tmp_path / "foo").touch()
+    with raises(RuntimeError):
+        torrent.create_torrent_file(path=tmp_path / "foo", webseeds=[], output=tmp_path / "foo.torrent")
 
-@patch("arch_release_promotion.torrent.urlopen")
-def test_get_webseeds(urlopen_mock: Mock) -> None:
-    artifact_type = "foo"
+
+@mark.parametrize(
+    "mirrorlist, webseeds",
+    [
+        (MIRRORLIST_BASIC, ["https://foo.bar/releases/{artifact_type}/0.1.0/"]),
+        (
+            MIRRORLIST_MULTIPLE,
+            ["https://foo.bar/releases/{artifact_type}/0.1.0/", "https://baz.bar/arch/releases/{artifact_type}/0.1.0/"],
+        ),
+        (MIRRORLIST_EMPTY, []),
+    ],
+)
+@patch("arch_release_promotion.torrent._session")
+def test_get_webseeds(session_mock: Mock, mirrorlist: bytes, webseeds: List[str]) -> None:
     mirrorlist_url = "https://foo.bar/mirrorlist"
     version = "0.1.0"
-    lines = b"# foo bar baz\n#Server = https://foo.bar/$repo/os/$arch\n"
-    urlopen_mock.return_value = MagicMock(read=Mock(return_value=lines))
+    session_mock.get.return_value = create_mirrorlist_response(mirrorlist)
 
+    torrent._read_mirrorlist_servers.cache_clear()
+    assert torrent.get_webseeds(
+        artifact_type="foo",
+        mirrorlist_urls=[mirrorlist_url],
+        version=version,
+    ) == [webseed.format(artifact_type="foo") for webseed in webseeds]
+    # the mirrorlist is only retrieved once for all artifact types
     assert torrent.get_webseeds(
-        artifact_type=artifact_type,
-        mirrorlist_url=mirrorlist_url,
+        artifact_type="bar",
+        mirrorlist_urls=[mirrorlist_url],
         version=version,
-    ) == [f"https://foo.bar/releases/{artifact_type}/{version}/"]
-    urlopen_mock.assert_called_once_with(mirrorlist_url)
+    ) == [webseed.format(artifact_type="bar") for webseed in webseeds]
+    session_mock.get.assert_called_once_with(mirrorlist_url, timeout=torrent.MIRRORLIST_TIMEOUT, stream=True)
+    torrent._read_mirrorlist_servers.cache_clear()
+
+
+@mark.parametrize(
+    "failures, expectation",
+    [
+        (1, does_not_raise()),
+        (2, raises(RuntimeError)),
+    ],
+)
+@patch("arch_release_promotion.torrent._session")
+def test_get_webseeds_fallback(session_mock: Mock, failures: int, expectation: ContextManager[str]) -> None:
+    mirrorlist_urls = ["https://foo.bar/mirrorlist", "https://bar.baz/mirrorlist"]
+    response = create_mirrorlist_response(b"#Server = https://foo.bar/$repo/os/$arch\n")
+    session_mock.get.side_effect = [ConnectionError("foo"), Timeout("bar")][:failures] + [response]
+
+    torrent._read_mirrorlist_servers.cache_clear()
+    with expectation:
+        assert torrent.get_webseeds(
+            artifact_type="foo", mirrorlist_urls=mirrorlist_urls, version="0.1.0", timeout=1
+        ) == ["https://foo.bar/releases/foo/0.1.0/"]
+    assert session_mock.get.call_args_list == [call(url, timeout=1, stream=True) for url in mirrorlist_urls]
+    torrent._read_mirrorlist_servers.cache_clear()